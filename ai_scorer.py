@@ -1,38 +1,102 @@
-import json
+import hashlib
+import heapq
+import itertools
 import logging
 import os
+import re
+import sqlite3
 import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from models import JobListing
+import fastjson
+from dedup import AI_SCORES_SCHEMA
+from models import DESCRIPTION_MAX_CHARS, JobListing
 from user_profile import get_profile
 
 logger = logging.getLogger(__name__)
 
-_raw_ollama_url = os.environ.get("OLLAMA_URL", "http://localhost:11434")
-_parsed = urlparse(_raw_ollama_url)
 _allowed_hosts = {"localhost", "127.0.0.1", "host.docker.internal"}
-if _parsed.scheme not in ("http", "https") or _parsed.hostname not in _allowed_hosts:
-    logger.warning(
-        f"OLLAMA_URL '{_raw_ollama_url}' is not a trusted local address — "
-        f"falling back to http://localhost:11434"
-    )
-    OLLAMA_URL = "http://localhost:11434"
-else:
-    OLLAMA_URL = _raw_ollama_url.rstrip("/")
+
+
+def _trusted_url(raw_url: str) -> str | None:
+    """Return the normalized URL if it points at a trusted local host, else None."""
+    parsed = urlparse(raw_url.strip())
+    if parsed.scheme not in ("http", "https") or parsed.hostname not in _allowed_hosts:
+        logger.warning(f"Ollama URL '{raw_url}' is not a trusted local address — ignoring it")
+        return None
+    return raw_url.strip().rstrip("/")
+
+
+# OLLAMA_URLS lists several instances (e.g. one per GPU on different ports)
+# to spread scoring requests across; otherwise OLLAMA_URL is the only one.
+_raw_ollama_urls = os.environ.get("OLLAMA_URLS") or os.environ.get(
+    "OLLAMA_URL", "http://localhost:11434"
+)
+OLLAMA_URLS = [
+    url for url in map(_trusted_url, _raw_ollama_urls.split(",")) if url
+] or ["http://localhost:11434"]
+OLLAMA_URL = OLLAMA_URLS[0]
 
 OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "llama3.2:latest")
 
-DEFAULT_PROMPT_TEMPLATE = (
-    "Score this job listing's fit for the candidate below.\n"
-    "Return ONLY valid JSON with these fields:\n"
+# Number of scoring requests kept in flight at once. Match this to the
+# OLLAMA_NUM_PARALLEL setting of `ollama serve` so requests are batched by
+# the server instead of queueing behind each other.
+OLLAMA_NUM_PARALLEL = max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")))
+
+# Jobs rendered into one prompt per request. 1 disables batching; larger
+# values amortize the shared candidate preamble across several listings.
+OLLAMA_BATCH_SIZE = max(1, int(os.environ.get("OLLAMA_BATCH_SIZE", "1")))
+
+# Context window per request. A single-job prompt plus its reply fits in
+# ~1500 tokens, and a smaller window shrinks each slot's KV cache so more
+# parallel slots fit in memory. Kept fixed for the whole run because Ollama
+# reloads the model whenever num_ctx changes between requests.
+OLLAMA_NUM_CTX = int(os.environ.get("OLLAMA_NUM_CTX", str(2048 * OLLAMA_BATCH_SIZE)))
+
+# One pooled session for every Ollama call so keep-alive connections are
+# reused across the whole ranking run instead of reconnecting per request.
+# Transient failures (connection resets, 502-504 while a model reloads) are
+# retried with exponential backoff; scoring requests are safe to resend.
+# Refused connections get a single immediate retry so a stopped Ollama is
+# still detected quickly.
+_retry = Retry(
+    total=3,
+    connect=1,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    raise_on_status=False,
+)
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=len(OLLAMA_URLS),
+    pool_maxsize=max(16, OLLAMA_NUM_PARALLEL),
+    max_retries=_retry,
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+_RESULT_FIELDS = (
     "- fit_score: integer 0-50\n"
     "- summary: string, 2 sentences max, what makes this role interesting\n"
     "- key_matches: list of 2-3 strongest qualification matches\n"
     "- gaps: list of any notable skill gaps\n"
     '- priority: "high", "medium", or "low"\n'
+)
+
+DEFAULT_PROMPT_TEMPLATE = (
+    "Score this job listing's fit for the candidate below.\n"
+    "Return ONLY valid JSON with these fields:\n"
+    + _RESULT_FIELDS +
     "\n"
     "CANDIDATE:\n"
     "$resume_summary\n"
@@ -45,17 +109,237 @@ DEFAULT_PROMPT_TEMPLATE = (
     "Location: $location"
 )
 
+_BATCH_TEMPLATE = string.Template(
+    "Score each job listing's fit for the candidate below.\n"
+    'Return ONLY valid JSON of the form {"results": [...]} where "results" '
+    "holds exactly $count objects, one per listing, in the same order as the "
+    "listings. Each object has these fields:\n"
+    + _RESULT_FIELDS +
+    "\n"
+    "CANDIDATE:\n"
+    "$resume_summary\n"
+    "\n"
+    "JOB LISTINGS:\n"
+    "$listings"
+)
 
-def _ollama_available() -> bool:
-    """Check if Ollama is running and the model is available."""
+_BATCH_LISTING_TEMPLATE = string.Template(
+    "$number) Title: $title\n"
+    "Company: $company\n"
+    "Description: $description\n"
+    "Salary: $salary_min\u2013$salary_max\n"
+    "Location: $location\n"
+)
+
+# JSON schemas passed as Ollama's `format` so sampling is constrained to a
+# well-formed result instead of free-form JSON that may wander or get wrapped.
+_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "fit_score": {"type": "integer", "minimum": 0, "maximum": 50},
+        "summary": {"type": "string"},
+        "key_matches": {"type": "array", "items": {"type": "string"}},
+        "gaps": {"type": "array", "items": {"type": "string"}},
+        "priority": {"type": "string", "enum": ["high", "medium", "low"]},
+    },
+    "required": ["fit_score", "summary", "priority"],
+}
+
+
+def _batch_schema(count: int) -> dict:
+    """Schema for a batch reply holding exactly ``count`` results."""
+    return {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": _RESULT_SCHEMA,
+                "minItems": count,
+                "maxItems": count,
+            },
+        },
+        "required": ["results"],
+    }
+
+
+_FALLBACK_RESULT = {"fit_score": 0, "summary": "", "key_matches": [], "gaps": [], "priority": "low"}
+
+_DEFAULT_TEMPLATE = string.Template(DEFAULT_PROMPT_TEMPLATE)
+
+# Prompt eval time grows with token count, so descriptions are compacted
+# before they are sent: control characters dropped, whitespace runs collapsed.
+_WHITESPACE_RE = re.compile(r"\s+")
+_CONTROL_CHARS = dict.fromkeys(c for c in range(32) if chr(c) not in "\t\n\r")
+_CONTROL_CHARS[127] = None
+
+
+@lru_cache(maxsize=4)
+def _get_template(raw_template: str) -> string.Template:
+    """Compile a prompt template once per distinct template string."""
+    return string.Template(raw_template)
+
+
+def _prompt_context() -> tuple[string.Template, str]:
+    """Snapshot the prompt template and resume summary from the current profile."""
+    p = get_profile()
+    raw_template = p.get("ai_prompt_template") or DEFAULT_PROMPT_TEMPLATE
+    return _get_template(raw_template), p["resume_summary"]
+
+
+def _compact_description(description: str) -> str:
+    """Strip control characters and collapse whitespace, then cap the length."""
+    desc = _WHITESPACE_RE.sub(" ", description.translate(_CONTROL_CHARS)).strip()
+    if len(desc) > DESCRIPTION_MAX_CHARS:
+        desc = desc[:DESCRIPTION_MAX_CHARS]
+    return desc
+
+
+@lru_cache(maxsize=512)
+def _money(amount: int) -> str:
+    """Format a salary figure; the same round numbers repeat across postings."""
+    return f"${amount:,}"
+
+
+def _job_fields(job: JobListing) -> dict:
+    """Template fields describing a single job listing."""
+    return {
+        "title": job.title,
+        "company": job.company,
+        "description": _compact_description(job.description),
+        "salary_min": _money(job.salary_min),
+        "salary_max": _money(job.salary_max),
+        "location": job.location,
+    }
+
+
+def _build_prompt(tmpl: string.Template, resume_summary: str, job: JobListing) -> str:
+    """Fill the prompt template with candidate and job details."""
+    return tmpl.safe_substitute(resume_summary=resume_summary, **_job_fields(job))
+
+
+def _build_batch_prompt(resume_summary: str, jobs: list[JobListing]) -> str:
+    """Render several listings into one prompt sharing a single candidate preamble."""
+    listings = "\n".join(
+        _BATCH_LISTING_TEMPLATE.safe_substitute(number=i, **_job_fields(job))
+        for i, job in enumerate(jobs, start=1)
+    )
+    return _BATCH_TEMPLATE.safe_substitute(
+        count=len(jobs), resume_summary=resume_summary, listings=listings,
+    )
+
+
+def _normalize_result(result: dict) -> dict:
+    """Fill in missing fields and clamp fit_score to 0-50."""
+    result.setdefault("fit_score", 0)
+    result.setdefault("summary", "")
+    result.setdefault("key_matches", [])
+    result.setdefault("gaps", [])
+    result.setdefault("priority", "low")
+    result["fit_score"] = max(0, min(50, int(result["fit_score"])))
+    return result
+
+
+# Decode cap per scored job. The result schema is small, so a reply that
+# needs more tokens than this has derailed and isn't worth finishing.
+_NUM_PREDICT_PER_JOB = 400
+
+
+# Round-robin over the instances that passed the last availability probe.
+_endpoint_lock = threading.Lock()
+_live_urls = list(OLLAMA_URLS)
+_endpoints = itertools.cycle(_live_urls)
+
+
+def _next_url() -> str:
+    """Pick the next live Ollama instance for a request."""
+    with _endpoint_lock:
+        return next(_endpoints)
+
+
+def _chat(
+    prompt: str,
+    num_predict: int = _NUM_PREDICT_PER_JOB,
+    schema: dict = _RESULT_SCHEMA,
+) -> str:
+    """Send a single-message chat request to Ollama and return the reply text.
+
+    The reply is streamed and the connection closed as soon as the
+    accumulated text parses as a JSON object, so Ollama stops generating
+    instead of running on after the object closes.
+    """
+    resp = _session.post(
+        f"{_next_url()}/api/chat",
+        data=fastjson.dumps({
+            "model": OLLAMA_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": True,
+            "format": schema,
+            "options": {
+                "num_ctx": OLLAMA_NUM_CTX,
+                "num_predict": num_predict,
+                "temperature": 0.2,
+                "top_p": 0.9,
+            },
+        }),
+        headers={"Content-Type": "application/json"},
+        timeout=120,
+        stream=True,
+    )
     try:
-        resp = requests.get(f"{OLLAMA_URL}/api/tags", timeout=5)
         resp.raise_for_status()
-        models = [m["name"] for m in resp.json().get("models", [])]
+        parts = []
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            chunk = fastjson.loads(line)
+            piece = chunk.get("message", {}).get("content", "")
+            parts.append(piece)
+            if "}" in piece:
+                text = "".join(parts).strip()
+                if text.endswith("}"):
+                    try:
+                        fastjson.loads(text)
+                        return text
+                    except fastjson.JSONDecodeError:
+                        pass
+            if chunk.get("done"):
+                break
+    finally:
+        resp.close()
+
+    text = "".join(parts).strip()
+    # Older Ollama versions ignore schemas and may wrap replies in a code block
+    if text.startswith("```"):
+        text = text.partition("\n")[2].rsplit("```", 1)[0].strip()
+    return text
+
+
+# Successful availability probes are trusted for this long so repeated
+# scoring calls in one process (e.g. dashboard searches) don't re-probe.
+_AVAILABILITY_TTL = 60
+_available_until = 0.0
+
+
+def _model_served(url: str) -> bool:
+    """Check one Ollama instance for the configured model."""
+    try:
+        # Fast path: the model is already loaded, no need to list every tag
+        try:
+            resp = _session.get(f"{url}/api/ps", timeout=5)
+            resp.raise_for_status()
+            loaded = {m["name"] for m in fastjson.loads(resp.content).get("models", [])}
+            if OLLAMA_MODEL in loaded:
+                return True
+        except (requests.RequestException, ValueError):
+            pass
+
+        resp = _session.get(f"{url}/api/tags", timeout=5)
+        resp.raise_for_status()
+        models = {m["name"] for m in fastjson.loads(resp.content).get("models", [])}
         if OLLAMA_MODEL not in models:
             logger.warning(
-                f"Ollama model '{OLLAMA_MODEL}' not found. "
-                f"Available: {', '.join(models)}"
+                f"Ollama model '{OLLAMA_MODEL}' not found at {url}. "
+                f"Available: {', '.join(sorted(models))}"
             )
             return False
         return True
@@ -63,98 +347,237 @@ def _ollama_available() -> bool:
         return False
 
 
-def ai_score(job: JobListing) -> dict:
-    """Use Ollama to score job fit and generate a summary."""
-    p = get_profile()
-    raw_template = p.get("ai_prompt_template") or DEFAULT_PROMPT_TEMPLATE
+def _ollama_available() -> bool:
+    """Check if Ollama is running and the model is available.
+
+    Every configured instance is probed; only those serving the model stay
+    in the request rotation.
+    """
+    global _available_until, _live_urls, _endpoints
+    if time.monotonic() < _available_until:
+        return True
+    live = [url for url in OLLAMA_URLS if _model_served(url)]
+    if not live:
+        return False
+    if len(live) < len(OLLAMA_URLS):
+        dead = [url for url in OLLAMA_URLS if url not in live]
+        logger.warning(f"Ollama unavailable at {', '.join(dead)} — using {len(live)} instance(s)")
+    with _endpoint_lock:
+        _live_urls = live
+        _endpoints = itertools.cycle(live)
+    _available_until = time.monotonic() + _AVAILABILITY_TTL
+    return True
+
+
+def ai_score(
+    job: JobListing,
+    tmpl: string.Template | None = None,
+    resume_summary: str | None = None,
+) -> dict:
+    """Use Ollama to score job fit and generate a summary.
+
+    ``tmpl`` and ``resume_summary`` let callers scoring many jobs reuse one
+    profile snapshot; when omitted they are read from the current profile.
+    """
+    if tmpl is None or resume_summary is None:
+        tmpl, resume_summary = _prompt_context()
     try:
-        tmpl = string.Template(raw_template)
-        prompt = tmpl.safe_substitute(
-            resume_summary=p["resume_summary"],
-            title=job.title,
-            company=job.company,
-            description=job.description[:3000],
-            salary_min=f"${job.salary_min:,}",
-            salary_max=f"${job.salary_max:,}",
-            location=job.location,
-        )
+        prompt = _build_prompt(tmpl, resume_summary, job)
     except (ValueError, TypeError) as e:
         logger.warning(f"Invalid prompt template, using default: {e}")
-        tmpl = string.Template(DEFAULT_PROMPT_TEMPLATE)
-        prompt = tmpl.safe_substitute(
-            resume_summary=p["resume_summary"],
-            title=job.title,
-            company=job.company,
-            description=job.description[:3000],
-            salary_min=f"${job.salary_min:,}",
-            salary_max=f"${job.salary_max:,}",
-            location=job.location,
-        )
+        prompt = _build_prompt(_DEFAULT_TEMPLATE, resume_summary, job)
 
-    resp = requests.post(
-        f"{OLLAMA_URL}/api/chat",
-        json={
-            "model": OLLAMA_MODEL,
-            "messages": [{"role": "user", "content": prompt}],
-            "stream": False,
-            "format": "json",
-        },
-        timeout=120,
-    )
-    resp.raise_for_status()
-    text = resp.json()["message"]["content"].strip()
+    text = _chat(prompt)
 
     try:
-        # Handle possible markdown code block wrapping
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
-        result = json.loads(text)
-        # Validate expected fields
-        result.setdefault("fit_score", 0)
-        result.setdefault("summary", "")
-        result.setdefault("key_matches", [])
-        result.setdefault("gaps", [])
-        result.setdefault("priority", "low")
-        # Clamp fit_score to 0-50
-        result["fit_score"] = max(0, min(50, int(result["fit_score"])))
-        return result
-    except (json.JSONDecodeError, IndexError, ValueError) as e:
+        return _normalize_result(fastjson.loads(text))
+    except (fastjson.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
         logger.warning(f"Failed to parse Ollama response for {job.title}: {e}")
-        return {"fit_score": 0, "summary": "", "key_matches": [], "gaps": [], "priority": "low"}
+        return dict(_FALLBACK_RESULT)
+
+
+def ai_score_batch(
+    jobs: list[JobListing],
+    resume_summary: str | None = None,
+) -> list[dict]:
+    """Score several jobs with one Ollama request. Returns one result per job, in order.
+
+    Raises ValueError if the reply is not a list of exactly ``len(jobs)``
+    result objects, so callers can fall back to scoring jobs one at a time.
+    """
+    if resume_summary is None:
+        resume_summary = get_profile()["resume_summary"]
+    text = _chat(
+        _build_batch_prompt(resume_summary, jobs),
+        num_predict=_NUM_PREDICT_PER_JOB * len(jobs),
+        schema=_batch_schema(len(jobs)),
+    )
+    try:
+        results = fastjson.loads(text)
+    except fastjson.JSONDecodeError as e:
+        raise ValueError(f"unparseable batch response: {e}") from e
+    if isinstance(results, dict):
+        results = results.get("results")
+    if not isinstance(results, list) or len(results) != len(jobs):
+        raise ValueError(f"expected {len(jobs)} results in batch response")
+    if not all(isinstance(r, dict) for r in results):
+        raise ValueError("batch response contains non-object results")
+    return [_normalize_result(r) for r in results]
+
+
+def _score_group(
+    jobs: list[JobListing],
+    tmpl: string.Template,
+    resume_summary: str,
+) -> list[dict | None]:
+    """Score a group of jobs, batching them when the default template is in use.
+
+    Batch prompts are built from the default instructions, so a custom
+    profile template always goes through the single-job path. A batch that
+    fails degrades to scoring each job on its own.
+    """
+    if len(jobs) > 1 and tmpl.template == DEFAULT_PROMPT_TEMPLATE:
+        try:
+            return ai_score_batch(jobs, resume_summary)
+        except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                f"  Batch scoring failed ({e}) — scoring {len(jobs)} jobs individually"
+            )
+
+    results = []
+    for job in jobs:
+        try:
+            results.append(ai_score(job, tmpl, resume_summary))
+        except Exception as e:
+            logger.warning(f"  AI scoring failed for {job.title}: {e}")
+            results.append(None)
+    return results
+
+
+def _context_hash(tmpl: string.Template, resume_summary: str) -> str:
+    """Hash of everything besides the job that shapes a score: model, template, resume."""
+    return hashlib.blake2b(
+        f"{OLLAMA_MODEL}|{tmpl.template}|{resume_summary}".encode(), digest_size=16,
+    ).hexdigest()
+
+
+def _cache_key(job: JobListing, context_hash: str) -> str:
+    """Cache key for one job scored under a given prompt context."""
+    return hashlib.blake2b(f"{job.url}|{context_hash}".encode(), digest_size=16).hexdigest()
+
+
+def _load_cached_scores(cache_path: str, keys: list[str]) -> dict[str, dict]:
+    """Fetch previously stored AI results for the given cache keys."""
+    conn = sqlite3.connect(cache_path)
+    try:
+        conn.execute(AI_SCORES_SCHEMA)
+        placeholders = ",".join("?" * len(keys))
+        rows = conn.execute(
+            f"SELECT key, result FROM ai_scores WHERE key IN ({placeholders})", keys,
+        ).fetchall()
+    finally:
+        conn.close()
+    return {key: fastjson.loads(result) for key, result in rows}
+
+
+def _store_cached_scores(cache_path: str, entries: dict[str, dict]) -> None:
+    """Persist freshly scored AI results.
+
+    The table is created here too: a ``refresh`` run never loads from the cache.
+    """
+    conn = sqlite3.connect(cache_path)
+    try:
+        conn.execute(AI_SCORES_SCHEMA)
+        conn.executemany(
+            "INSERT OR REPLACE INTO ai_scores (key, result) VALUES (?, ?)",
+            [(key, fastjson.dumps(result).decode()) for key, result in entries.items()],
+        )
+        conn.commit()
+    finally:
+        conn.close()
 
 
 def score_top_jobs(
     jobs: list[JobListing],
     rule_scores: list[float],
     top_n: int = 15,
+    cache_path: str | None = None,
+    refresh: bool = False,
+    min_rule_score: float = 0,
 ) -> list[dict]:
-    """AI-score the top N jobs by rule-based score. Returns list of AI result dicts."""
-    if not _ollama_available():
-        logger.warning(f"Ollama not available at {OLLAMA_URL} — skipping AI scoring")
+    """AI-score the top N jobs by rule-based score. Returns list of AI result dicts.
+
+    Jobs whose rule score is below ``min_rule_score`` are never sent to Ollama.
+
+    With ``cache_path``, results are stored in an ``ai_scores`` table keyed by
+    job URL, model, prompt template and resume, so a job seen on an earlier
+    run is not sent to Ollama again. ``refresh`` ignores stored results.
+    """
+    # Pair jobs with their original index and rule scores, then keep the top N
+    # by score (same order as a full descending sort, ties included)
+    top = heapq.nlargest(top_n, enumerate(zip(jobs, rule_scores)), key=lambda x: x[1][1])
+    if min_rule_score > 0:
+        top = [entry for entry in top if entry[1][1] >= min_rule_score]
+    if not top:
         return [None] * len(jobs)
 
+    tmpl, resume_summary = _prompt_context()
+
+    results = {}
+    keys = {}
+    if cache_path:
+        context_hash = _context_hash(tmpl, resume_summary)
+        keys = {idx: _cache_key(job, context_hash) for idx, (job, _score) in top}
+        cached = {} if refresh else _load_cached_scores(cache_path, list(keys.values()))
+        results = {idx: cached[key] for idx, key in keys.items() if key in cached}
+        if results:
+            logger.info(f"AI scores reused from cache: {len(results)}/{len(top)}")
+
+    pending = [entry for entry in top if entry[0] not in results]
+    if not pending:
+        return [results.get(i) for i in range(len(jobs))]
+
+    if not _ollama_available():
+        logger.warning(
+            f"Ollama not available at {', '.join(OLLAMA_URLS)} — skipping AI scoring"
+        )
+        return [results.get(i) for i in range(len(jobs))]
+
     logger.info(f"AI scoring with Ollama model: {OLLAMA_MODEL}")
 
-    # Pair jobs with their original index and rule scores, then sort by score
-    indexed = sorted(
-        enumerate(zip(jobs, rule_scores)),
-        key=lambda x: x[1][1],
-        reverse=True,
-    )
+    # Requests are I/O-bound, so overlap them on a small thread pool and let
+    # Ollama's parallel slots process several prompts at once.
+    groups = [
+        pending[i:i + OLLAMA_BATCH_SIZE] for i in range(0, len(pending), OLLAMA_BATCH_SIZE)
+    ]
+    fresh = {}
+    done = 0
+    # Each live instance gets its own OLLAMA_NUM_PARALLEL requests in flight
+    workers = min(OLLAMA_NUM_PARALLEL * len(_live_urls), len(groups))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                _score_group, [job for _, (job, _score) in group], tmpl, resume_summary,
+            ): group
+            for group in groups
+        }
+        for future in as_completed(futures):
+            group = futures[future]
+            for (orig_idx, (job, _score)), result in zip(group, future.result()):
+                done += 1
+                results[orig_idx] = result
+                if result is not None:
+                    # Parse failures come back as the fallback; retry those next run
+                    if result != _FALLBACK_RESULT and orig_idx in keys:
+                        fresh[keys[orig_idx]] = result
+                    logger.info(
+                        f"  AI scored [{done}/{len(pending)}]: "
+                        f"{job.title} @ {job.company} -> {result.get('fit_score', 0)}/50 "
+                        f"({result.get('priority', 'low')})"
+                    )
 
-    results = {}
-    for rank, (orig_idx, (job, _score)) in enumerate(indexed[:top_n]):
-        try:
-            result = ai_score(job)
-            results[orig_idx] = result
-            logger.info(
-                f"  AI scored [{rank+1}/{min(top_n, len(indexed))}]: "
-                f"{job.title} @ {job.company} -> {result.get('fit_score', 0)}/50 "
-                f"({result.get('priority', 'low')})"
-            )
-        except Exception as e:
-            logger.warning(f"  AI scoring failed for {job.title}: {e}")
-            results[orig_idx] = None
+    if fresh:
+        _store_cached_scores(cache_path, fresh)
 
     # Return results in original order, None for jobs not scored
     return [results.get(i) for i in range(len(jobs))]
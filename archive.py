@@ -1,5 +1,6 @@
 import os
 from datetime import date, datetime, timezone
+from functools import lru_cache
 
 
 def save_daily_report(ranked_jobs: list[dict], output_dir: str = "reports/") -> str:
@@ -9,13 +10,17 @@ def save_daily_report(ranked_jobs: list[dict], output_dir: str = "reports/") ->
     filename = os.path.join(output_dir, f"{today}.md")
 
     lines = [f"# Job Search Report — {today}\n"]
+    now = datetime.now(timezone.utc)
 
     if not ranked_jobs:
         lines.append("No new matching jobs found today.\n")
     else:
-        high = [j for j in ranked_jobs if j.get("priority") == "high"]
-        medium = [j for j in ranked_jobs if j.get("priority") == "medium"]
-        low = [j for j in ranked_jobs if j.get("priority") == "low"]
+        buckets = {"high": [], "medium": [], "low": []}
+        for j in ranked_jobs:
+            bucket = buckets.get(j.get("priority"))
+            if bucket is not None:
+                bucket.append(j)
+        high, medium, low = buckets["high"], buckets["medium"], buckets["low"]
 
         lines.append(f"**{len(ranked_jobs)} new matches** — "
                       f"{len(high)} high, {len(medium)} medium, {len(low)} low priority\n")
@@ -23,27 +28,31 @@ def save_daily_report(ranked_jobs: list[dict], output_dir: str = "reports/") ->
         if high:
             lines.append("## High Priority\n")
             for job in high:
-                lines.extend(_render_job(job))
+                _render_job(job, lines, now)
 
         if medium:
             lines.append("## Worth a Look\n")
             for job in medium:
-                lines.extend(_render_job(job))
+                _render_job(job, lines, now)
 
         if low:
             lines.append("## Other Matches\n")
             for job in low:
-                lines.extend(_render_job(job))
+                _render_job(job, lines, now)
 
-    with open(filename, "w") as f:
-        f.write("\n".join(lines))
+    # Write line by line through a large buffer rather than joining the
+    # whole report into a second in-memory copy first.
+    with open(filename, "w", buffering=64 * 1024) as f:
+        f.write(lines[0])
+        for line in lines[1:]:
+            f.write("\n")
+            f.write(line)
 
     return filename
 
 
-def _render_job(job: dict) -> list[str]:
-    """Render a single job entry as markdown lines."""
-    lines = []
+def _render_job(job: dict, lines: list[str], now: datetime | None = None) -> None:
+    """Append a single job entry to ``lines`` as markdown lines."""
     title = job.get("title", "Unknown")
     company = job.get("company", "Unknown")
     url = job.get("url", "")
@@ -54,15 +63,12 @@ def _render_job(job: dict) -> list[str]:
     lines.append(f"**Score:** {score:.0f}/100 | **Source:** {source}")
 
     if job.get("salary_min") or job.get("salary_max"):
-        sal_min = job.get("salary_min", 0)
-        sal_max = job.get("salary_max", 0)
-        if sal_min and sal_max:
-            lines.append(f"**Salary:** ${sal_min:,}–${sal_max:,}")
-        elif sal_min:
-            lines.append(f"**Salary:** ${sal_min:,}+")
+        salary = _fmt_salary(job.get("salary_min", 0), job.get("salary_max", 0))
+        if salary:
+            lines.append(f"**Salary:** {salary}")
 
     if job.get("posted_date"):
-        lines.append(f"**Posted:** {_format_posted(job['posted_date'])}")
+        lines.append(f"**Posted:** {_format_posted(job['posted_date'], now)}")
 
     if job.get("location"):
         lines.append(f"**Location:** {job['location']}")
@@ -71,16 +77,36 @@ def _render_job(job: dict) -> list[str]:
         lines.append(f"\n{job['summary']}")
 
     lines.append("")  # blank line between entries
-    return lines
 
 
-def _format_posted(posted_iso: str) -> str:
-    """Format posted_date ISO string as human-readable age."""
+@lru_cache(maxsize=1024)
+def _fmt_salary(sal_min: int, sal_max: int) -> str:
+    """Format a salary range; the same bands repeat across many listings."""
+    if sal_min and sal_max:
+        return f"${sal_min:,}–${sal_max:,}"
+    elif sal_min:
+        return f"${sal_min:,}+"
+    return ""
+
+
+@lru_cache(maxsize=1024)
+def _parse_posted(posted_iso: str) -> datetime:
+    """Parse a posted_date ISO string as an aware datetime (UTC if naive)."""
+    if posted_iso.endswith("Z"):
+        # fromisoformat() only accepts a trailing Z from Python 3.11
+        posted_iso = posted_iso[:-1] + "+00:00"
+    posted = datetime.fromisoformat(posted_iso)
+    if posted.tzinfo is None:
+        posted = posted.replace(tzinfo=timezone.utc)
+    return posted
+
+
+def _format_posted(posted_iso: str, now: datetime | None = None) -> str:
+    """Format posted_date ISO string as human-readable age relative to ``now``."""
     try:
-        posted = datetime.fromisoformat(posted_iso)
-        now = datetime.now(timezone.utc)
-        if posted.tzinfo is None:
-            posted = posted.replace(tzinfo=timezone.utc)
+        posted = _parse_posted(posted_iso)
+        if now is None:
+            now = datetime.now(timezone.utc)
         days = (now - posted).days
         if days == 0:
             return "Today"
@@ -90,5 +116,5 @@ def _format_posted(posted_iso: str) -> str:
             return f"{days} days ago"
         else:
             return posted.strftime("%Y-%m-%d")
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, AttributeError):
         return posted_iso
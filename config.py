@@ -1,14 +1,28 @@
-"""Configuration derived from profile.json. Backward-compatible exports."""
+"""Configuration derived from profile.json. Backward-compatible exports.
+
+Profile-derived constants are loaded lazily on first attribute access, so
+importing this module doesn't read profile.json.
+"""
+
+import threading
 
 from user_profile import get_profile
 
+_PROFILE_NAMES = frozenset({
+    "SEARCH_QUERIES", "PRIORITY_COMPANIES", "INDUSTRIES",
+    "SALARY_MIN", "SALARY_MAX", "SALARY_FLOOR",
+    "GREENHOUSE_BOARDS", "ROLE_KEYWORDS",
+    "MAX_JOB_AGE_DAYS", "MIN_RULE_SCORE",
+})
+_lock = threading.RLock()
+
 
 def _load():
     """Load all config values from the current profile."""
     global SEARCH_QUERIES, PRIORITY_COMPANIES, INDUSTRIES
     global SALARY_MIN, SALARY_MAX, SALARY_FLOOR
     global GREENHOUSE_BOARDS, ROLE_KEYWORDS
-    global MAX_JOB_AGE_DAYS
+    global MAX_JOB_AGE_DAYS, MIN_RULE_SCORE
 
     _p = get_profile()
     SEARCH_QUERIES = _p["role_tags"]
@@ -18,8 +32,9 @@ def _load():
     SALARY_MAX = _p["salary_range"]["max"]
     SALARY_FLOOR = _p["salary_range"].get("floor", 100000)
     GREENHOUSE_BOARDS = _p.get("greenhouse_boards", {})
-    ROLE_KEYWORDS = [tag.lower() for tag in _p["role_tags"]]
+    ROLE_KEYWORDS = tuple(tag.lower() for tag in _p["role_tags"])
     MAX_JOB_AGE_DAYS = _p.get("max_job_age_days", 30)
+    MIN_RULE_SCORE = _p.get("min_rule_score", 0)
 
 
 EMPLOYMENT_TYPE = "full-time"
@@ -38,10 +53,18 @@ US_STATES = [
     "WI", "WY", "DC",
 ]
 
-# Initial load
-_load()
+def __getattr__(name):
+    """Load profile-derived constants on first access (PEP 562)."""
+    if name not in _PROFILE_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _lock:
+        if name not in globals():
+            _load()
+        return globals()[name]
 
 
 def reload():
-    """Re-read profile.json and refresh all module-level constants."""
-    _load()
+    """Drop the loaded constants so the next access re-reads the current profile."""
+    with _lock:
+        for name in _PROFILE_NAMES:
+            globals().pop(name, None)
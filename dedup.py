@@ -1,74 +1,262 @@
+import atexit
 import hashlib
+import os
 import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 
-from thefuzz import fuzz
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 
 from models import JobListing
 
+# Strip Latin-1 characters before matching, as thefuzz's full_process did
+_ASCII_ONLY = {i: None for i in range(128, 256)}
 
+
+@lru_cache(maxsize=8192)
 def _stable_hash(text: str) -> str:
-    """Deterministic hash that's consistent across process restarts."""
-    return hashlib.sha256(text.lower().strip().encode()).hexdigest()[:16]
+    """Deterministic hash that's consistent across process restarts.
+
+    A dedup key, not a security boundary, so a fast 64-bit BLAKE2b digest
+    stands in for the SHA-256 prefix used before (see ``_migrate``).
+    """
+    return hashlib.blake2b(text.lower().strip().encode(), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=8192)
+def _normalize(text: str) -> str:
+    """Lowercase, ASCII-only, alphanumeric tokens — the form titles are matched in.
+
+    Cached because company names, and many titles, repeat across sources.
+    """
+    return default_process(str(text).translate(_ASCII_ONLY))
+
+
+class _SeenIndex:
+    """Normalized titles of kept jobs, blocked by normalized company.
+
+    A duplicate needs both company and title above the threshold, so the
+    company is matched first against the distinct companies only, and
+    titles are compared just within the matching companies' blocks.
+    """
+
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+        self.blocks: dict[str, list[str]] = {}
+        self.companies: list[str] = []
+        self.exact: set[tuple[str, str]] = set()
+
+    def add(self, title: str, company: str) -> None:
+        self.exact.add((title, company))
+        block = self.blocks.get(company)
+        if block is None:
+            block = self.blocks[company] = []
+            self.companies.append(company)
+        block.append(title)
+
+    def matches(self, title: str, company: str) -> bool:
+        """True if a kept job's title and company both score above threshold.
+
+        Scores are rounded like thefuzz's integer ratios, and an empty title
+        or company never matches, as thefuzz scored empty strings 0. Exact
+        repeats, the common case for a role cross-posted verbatim, score 100
+        and skip the fuzzy search.
+        """
+        if not title or not company:
+            return False
+        if self.threshold < 100 and (title, company) in self.exact:
+            return True
+        company_hits = process.extract(
+            company, self.companies, scorer=fuzz.token_sort_ratio,
+            score_cutoff=self.threshold, limit=None,
+        )
+        for _, company_score, idx in company_hits:
+            if round(company_score) <= self.threshold:
+                continue
+            best = process.extractOne(
+                title, self.blocks[self.companies[idx]], scorer=fuzz.token_sort_ratio,
+                score_cutoff=self.threshold,
+            )
+            if best is not None and round(best[1]) > self.threshold:
+                return True
+        return False
 
 
 def is_duplicate(job: JobListing, seen_jobs: list[JobListing], threshold: int = 85) -> bool:
     """Fuzzy match on title + company to catch cross-posted roles."""
+    index = _SeenIndex(threshold)
     for seen in seen_jobs:
-        title_score = fuzz.token_sort_ratio(job.title, seen.title)
-        company_score = fuzz.token_sort_ratio(job.company, seen.company)
-        if title_score > threshold and company_score > threshold:
-            return True
-    return False
+        index.add(_normalize(seen.title), _normalize(seen.company))
+    return index.matches(_normalize(job.title), _normalize(job.company))
+
+
+def dedupe(jobs: list[JobListing], threshold: int = 85) -> list[JobListing]:
+    """Drop cross-posted duplicates, keeping the first of each; see ``is_duplicate``.
+
+    The index of kept jobs is built up incrementally, so each job is
+    normalized once rather than once per comparison.
+    """
+    unique = []
+    index = _SeenIndex(threshold)
+    for job in jobs:
+        title, company = _normalize(job.title), _normalize(job.company)
+        if not index.matches(title, company):
+            unique.append(job)
+            index.add(title, company)
+    return unique
+
+
+# One connection per database file, shared by every call in the process.
+# The pipeline and the dashboard server's worker thread both use it, so
+# access is serialised with a lock.
+_connections: dict[str, sqlite3.Connection] = {}
+_db_lock = threading.RLock()
+
+
+@contextmanager
+def _db(db_path: str):
+    """Yield the shared connection for ``db_path``, opening it on first use."""
+    key = os.path.abspath(db_path)
+    with _db_lock:
+        conn = _connections.get(key)
+        if conn is None:
+            conn = sqlite3.connect(key, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _connections[key] = conn
+        yield conn
+
+
+@atexit.register
+def close_db() -> None:
+    """Close every shared connection.
+
+    Closing the last connection checkpoints the WAL back into the database
+    file, which is the only file CI keeps between runs.
+    """
+    with _db_lock:
+        while _connections:
+            _connections.popitem()[1].close()
+
+
+def reset_db(db_path: str = "seen_jobs.db") -> bool:
+    """Close the shared connection and delete the database and its WAL files.
+
+    Returns True if a database file was removed.
+    """
+    key = os.path.abspath(db_path)
+    with _db_lock:
+        conn = _connections.pop(key, None)
+        if conn is not None:
+            conn.close()
+        removed = os.path.exists(key)
+        for path in (key, key + "-wal", key + "-shm"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    return removed
+
+
+# Cache of AI scoring results; see ai_scorer.score_top_jobs
+AI_SCORES_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS ai_scores ("
+    "key TEXT PRIMARY KEY, result TEXT, scored_at DATE DEFAULT CURRENT_DATE)"
+)
 
 
 def init_db(db_path: str = "seen_jobs.db") -> None:
     """Initialize the SQLite database with schema."""
-    conn = sqlite3.connect(db_path)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS seen_jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            url TEXT UNIQUE,
-            title TEXT,
-            title_hash TEXT,
-            company TEXT,
-            source TEXT,
-            first_seen DATE DEFAULT CURRENT_DATE,
-            score REAL DEFAULT 0,
-            status TEXT DEFAULT 'new'
+    with _db(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT UNIQUE,
+                title TEXT,
+                title_hash TEXT,
+                company TEXT,
+                source TEXT,
+                first_seen DATE DEFAULT CURRENT_DATE,
+                score REAL DEFAULT 0,
+                status TEXT DEFAULT 'new'
+            )
+        """)
+        # url is already indexed by its UNIQUE constraint; this covers the
+        # (company, title_hash) half of the seen-check
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_seen_company_hash ON seen_jobs(company, title_hash)"
         )
-    """)
-    conn.commit()
-    conn.close()
+        conn.execute(AI_SCORES_SCHEMA)
+        _migrate(conn)
+        conn.commit()
+
+
+# Bumped when stored values need rewriting; kept in PRAGMA user_version.
+_SCHEMA_VERSION = 1
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Bring an existing seen_jobs table up to ``_SCHEMA_VERSION``."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < 1:
+        # title_hash switched from a SHA-256 prefix to BLAKE2b; titles are
+        # stored alongside, so existing rows can simply be rehashed.
+        conn.create_function("stable_hash", 1, _stable_hash, deterministic=True)
+        conn.execute("UPDATE seen_jobs SET title_hash = stable_hash(title) WHERE title IS NOT NULL")
+    conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
 
 def was_previously_sent(job: JobListing, db_path: str = "seen_jobs.db") -> bool:
     """Check SQLite database of previously delivered listings."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.execute(
-        "SELECT 1 FROM seen_jobs WHERE url = ? OR (company = ? AND title_hash = ?)",
-        (job.url, job.company, _stable_hash(job.title)),
-    )
-    result = cursor.fetchone()
-    conn.close()
-    return result is not None
+    return was_previously_sent_batch([job], db_path)[0]
+
+
+def was_previously_sent_batch(jobs: list[JobListing], db_path: str = "seen_jobs.db") -> list[bool]:
+    """``was_previously_sent`` for many jobs in one query; results follow ``jobs`` order.
+
+    The candidates go into a temp table that is joined against seen_jobs once
+    by URL and once by (company, title_hash).
+    """
+    if not jobs:
+        return []
+    with _db(db_path) as conn:
+        conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS candidates "
+            "(idx INTEGER PRIMARY KEY, url TEXT, company TEXT, title_hash TEXT)"
+        )
+        conn.execute("DELETE FROM candidates")
+        conn.executemany(
+            "INSERT INTO candidates VALUES (?, ?, ?, ?)",
+            [(i, job.url, job.company, _stable_hash(job.title)) for i, job in enumerate(jobs)],
+        )
+        rows = conn.execute(
+            "SELECT c.idx FROM candidates c JOIN seen_jobs s ON s.url = c.url "
+            "UNION "
+            "SELECT c.idx FROM candidates c JOIN seen_jobs s "
+            "ON s.company = c.company AND s.title_hash = c.title_hash"
+        ).fetchall()
+        conn.commit()
+    sent = {idx for (idx,) in rows}
+    return [i in sent for i in range(len(jobs))]
 
 
 def mark_as_sent(job: JobListing, score: float = 0, db_path: str = "seen_jobs.db") -> None:
     """Record a job listing in the seen database."""
-    conn = sqlite3.connect(db_path)
-    try:
-        conn.execute(
+    mark_as_sent_batch([(job, score)], db_path)
+
+
+def mark_as_sent_batch(
+    entries: list[tuple[JobListing, float]], db_path: str = "seen_jobs.db",
+) -> None:
+    """Record many ``(job, score)`` pairs in a single transaction."""
+    with _db(db_path) as conn, conn:
+        conn.executemany(
             "INSERT OR IGNORE INTO seen_jobs (url, title, title_hash, company, source, score) "
             "VALUES (?, ?, ?, ?, ?, ?)",
-            (
-                job.url,
-                job.title,
-                _stable_hash(job.title),
-                job.company,
-                job.source,
-                score,
-            ),
+            [
+                (job.url, job.title, _stable_hash(job.title), job.company, job.source, score)
+                for job, score in entries
+            ],
         )
-        conn.commit()
-    finally:
-        conn.close()
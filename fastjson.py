@@ -0,0 +1,29 @@
+"""JSON encode/decode using orjson when installed, stdlib json otherwise."""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of which backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes):
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, default=None) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes.
+
+    ``default`` converts otherwise unserializable objects, as in json.dumps.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default).encode()
@@ -1,6 +1,7 @@
 import logging
 import re
-from datetime import datetime, timedelta, timezone
+import time
+from functools import lru_cache
 
 import config as config
 from models import JobListing
@@ -55,31 +56,119 @@ NON_BOSTON_US_CITIES = [
     "centennial", "mountain view", "palo alto", "sunnyvale",
 ]
 
+# Whole-location values that mean remote anywhere in the US
+UNQUALIFIED_REMOTE_LOCATIONS = frozenset({"remote", "remote - us east", "remote - us west", ""})
+US_EXACT_LOCATIONS = frozenset({"us", "u.s.", "u.s.a."})
+
+# Broad US-wide signals in a location (only trusted once pinning is ruled out)
+US_WIDE_PATTERNS = [
+    "united states",
+    "united states - remote",
+    "united states of america",
+    "usa",
+    "us remote",
+    "remote - us",
+    "remote us",
+    "remote, us",
+    "nationwide",
+    "anywhere in the us",
+    "anywhere in the world",
+    "worldwide",
+]
+
+# Description phrases that restrict a remote role to a place; checked in order
+RESTRICTION_SIGNALS = (
+    "must be located in",
+    "must reside in",
+    "candidates must be based in",
+    "hiring remotely in",
+    "remote from",
+    "this role is open to candidates in",
+    "open to remote candidates in",
+    "based out of",
+)
+
+# Title signals for roles below the target seniority
+JUNIOR_SIGNALS = ("junior", "associate", "entry level", "intern")
+
+# Non-Boston state abbreviations, matched case-sensitively in the original
+# location (e.g. "FL, USA" or "TX, USA") — "MA" is deliberately absent
+NON_BOSTON_STATE_ABBREVS = [
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID",
+    "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MI", "MN", "MS",
+    "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK",
+    "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV",
+    "WI", "WY", "DC",
+]
+
 
-def passes_hard_filters(job: JobListing) -> bool:
+def _keyword_pattern(words: list[str], whole_word: bool = False) -> re.Pattern:
+    """Compile substring keywords into one regex shaped like a prefix trie.
+
+    ``pattern.search(text)`` is true iff any keyword occurs in text, found in
+    a single pass instead of one ``in`` scan per keyword. Only presence is
+    reported: a keyword that extends a shorter one is dropped, unless
+    ``whole_word`` anchors every keyword at word boundaries.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end of keyword
+
+    def build(node: dict) -> str:
+        ends = "" in node
+        if ends and not whole_word:
+            return ""
+        alts = [re.escape(ch) + build(child) for ch, child in node.items() if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if ends else body
+
+    body = build(trie)
+    return re.compile(rf"\b{body}\b" if whole_word else body)
+
+
+# Short signals (e.g. "uk", "uae") need word boundaries to avoid matching
+# "unlock", "bulk", etc.; longer ones are plain substring matches.
+_SHORT_NON_US_PATTERN = _keyword_pattern(
+    [s for s in NON_US_SIGNALS if len(s) <= 3], whole_word=True
+)
+_LONG_NON_US_PATTERN = _keyword_pattern([s for s in NON_US_SIGNALS if len(s) > 3])
+_BOSTON_PATTERN = _keyword_pattern(BOSTON_SIGNALS)
+_NON_BOSTON_PLACE_PATTERN = _keyword_pattern(NON_BOSTON_US_STATES + NON_BOSTON_US_CITIES)
+_US_WIDE_PATTERN = _keyword_pattern(US_WIDE_PATTERNS)
+_STATE_ABBREV_PATTERN = _keyword_pattern(NON_BOSTON_STATE_ABBREVS, whole_word=True)
+
+
+def passes_hard_filters(job: JobListing, now: float | None = None) -> bool:
     """Reject listings that clearly don't match. Enforces:
     - US-wide remote (not state-restricted) or hybrid/on-site Boston
     - Role keyword match
     - Not junior
     - Salary floor
+
+    Pass ``now`` (epoch seconds) when filtering a batch so the clock is read once.
     """
-    title_lower = job.title.lower()
+    # Checks run cheapest and most selective first; all must pass.
+    # Salary floor check (if salary data is available)
+    if job.salary_max > 0 and job.salary_max < config.SALARY_FLOOR:
+        return False
+
+    title_lower = job.title_lower
 
     # Must match at least one target role family keyword
     if not any(kw in title_lower for kw in config.ROLE_KEYWORDS):
         return False
 
     # Reject junior roles
-    junior_signals = ["junior", "associate", "entry level", "intern"]
-    if any(signal in title_lower for signal in junior_signals):
-        return False
-
-    # Salary floor check (if salary data is available)
-    if job.salary_max > 0 and job.salary_max < config.SALARY_FLOOR:
+    if any(signal in title_lower for signal in JUNIOR_SIGNALS):
         return False
 
     # Staleness check — reject jobs older than MAX_JOB_AGE_DAYS
-    if not _passes_age_filter(job):
+    if not _passes_age_filter(job, now):
         return False
 
     # --- Location filter ---
@@ -89,17 +178,15 @@ def passes_hard_filters(job: JobListing) -> bool:
     return True
 
 
-def _passes_age_filter(job: JobListing) -> bool:
-    """Reject jobs older than MAX_JOB_AGE_DAYS."""
+def _passes_age_filter(job: JobListing, now: float | None = None) -> bool:
+    """Reject jobs older than MAX_JOB_AGE_DAYS. ``now`` is epoch seconds."""
     if config.MAX_JOB_AGE_DAYS <= 0:
         return True  # Disabled
-    now = datetime.now(timezone.utc)
-    posted = job.posted_date
-    if posted.tzinfo is None:
-        posted = posted.replace(tzinfo=timezone.utc)
-    age = now - posted
-    if age.days > config.MAX_JOB_AGE_DAYS:
-        logger.debug(f"Rejecting stale job ({age.days}d old): {job.title} @ {job.company}")
+    if now is None:
+        now = time.time()
+    age_days = (now - job.posted_ts) // 86400
+    if age_days > config.MAX_JOB_AGE_DAYS:
+        logger.debug(f"Rejecting stale job ({age_days:.0f}d old): {job.title} @ {job.company}")
         return False
     return True
 
@@ -109,10 +196,10 @@ def _passes_location_filter(job: JobListing) -> bool:
     1. US-wide remote roles (no specific state/city restriction)
     2. Hybrid or on-site roles in the Boston area
     """
-    loc_lower = job.location.lower().strip()
+    loc_lower = job.location_lower.strip()
     loc_original = job.location.strip()  # Preserve case for abbreviation matching
-    title_lower = job.title.lower()
-    desc_lower = job.description.lower()
+    title_lower = job.title_lower
+    desc_lower = job.description_lower
 
     # Reject if location clearly indicates non-US
     if _is_non_us(loc_lower) or _is_non_us(title_lower):
@@ -141,15 +228,16 @@ def _is_us_wide_remote(loc_lower: str, loc_original: str, title: str, desc: str)
     """Check if a remote role is truly US-wide, not restricted to specific states/cities."""
 
     # Location is just "remote" with no qualifier — accept
-    if loc_lower in ("remote", "remote - us east", "remote - us west", ""):
+    if loc_lower in UNQUALIFIED_REMOTE_LOCATIONS:
         return True
 
     # "N Locations" without specifics — accept (common on BuiltIn)
-    if re.match(r"^\d+ locations?$", loc_lower):
+    count, _, word = loc_lower.partition(" ")
+    if count.isdecimal() and word in ("location", "locations"):
         return True
 
     # Just "US" as the whole location
-    if loc_lower in ("us", "u.s.", "u.s.a."):
+    if loc_lower in US_EXACT_LOCATIONS:
         return True
 
     # IMPORTANT: Check pinning BEFORE US-wide patterns, because locations
@@ -159,42 +247,16 @@ def _is_us_wide_remote(loc_lower: str, loc_original: str, title: str, desc: str)
         return False
 
     # Broad US-wide signals in location field (checked AFTER pinning)
-    us_wide_patterns = [
-        "united states",
-        "united states - remote",
-        "united states of america",
-        "usa",
-        "us remote",
-        "remote - us",
-        "remote us",
-        "remote, us",
-        "nationwide",
-        "anywhere in the us",
-        "anywhere in the world",
-        "worldwide",
-    ]
-
-    for pattern in us_wide_patterns:
-        if pattern in loc_lower:
-            return True
+    if _US_WIDE_PATTERN.search(loc_lower):
+        return True
 
     # Check the description for location restrictions
-    restriction_signals = [
-        "must be located in",
-        "must reside in",
-        "candidates must be based in",
-        "hiring remotely in",
-        "remote from",
-        "this role is open to candidates in",
-        "open to remote candidates in",
-        "based out of",
-    ]
-    for sig in restriction_signals:
-        if sig in desc:
-            # Check if the restriction is to Boston/MA — that's fine
-            idx = desc.index(sig)
-            context = desc[idx:idx+100]
-            if _is_boston(context):
+    for sig in RESTRICTION_SIGNALS:
+        idx = desc.find(sig)
+        if idx != -1:
+            # Check if the restriction is to Boston/MA — that's fine.
+            # Search the 100-char window in place rather than slicing it.
+            if _BOSTON_PATTERN.search(desc, idx, idx + 100):
                 return True
             # Restricted to somewhere else
             return False
@@ -205,47 +267,27 @@ def _is_us_wide_remote(loc_lower: str, loc_original: str, title: str, desc: str)
     return False
 
 
+@lru_cache(maxsize=4096)
 def _is_pinned_to_non_boston_location(loc_lower: str, loc_original: str) -> bool:
     """Check if a location string pins the role to a specific non-Boston US place."""
-    # Check for specific non-Boston state names (lowercase comparison)
-    for state in NON_BOSTON_US_STATES:
-        if state in loc_lower:
-            return True
-
-    # Check for non-Boston city names (lowercase comparison)
-    for city in NON_BOSTON_US_CITIES:
-        if city in loc_lower:
-            return True
+    # Check for non-Boston state and city names (lowercase comparison)
+    if _NON_BOSTON_PLACE_PATTERN.search(loc_lower):
+        return True
 
     # Check for state abbreviations (2-letter) in ORIGINAL case location
     # e.g. "FL, USA" or "TX, USA" or "OH, USA" — but not "MA"
-    non_boston_abbrevs = [
-        "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID",
-        "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MI", "MN", "MS",
-        "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK",
-        "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV",
-        "WI", "WY", "DC",
-    ]
-    for abbr in non_boston_abbrevs:
-        if re.search(rf'\b{abbr}\b', loc_original):
-            return True
-
-    return False
+    return _STATE_ABBREV_PATTERN.search(loc_original) is not None
 
 
+@lru_cache(maxsize=4096)
 def _is_boston(text: str) -> bool:
     """Check if text references the Boston area."""
-    return any(sig in text for sig in BOSTON_SIGNALS)
+    return _BOSTON_PATTERN.search(text) is not None
 
 
+@lru_cache(maxsize=4096)
 def _is_non_us(text: str) -> bool:
     """Check if text clearly indicates a non-US country/region."""
-    for sig in NON_US_SIGNALS:
-        if len(sig) <= 3:
-            # Short signals (e.g. "uk", "uae") need word boundaries
-            # to avoid matching "unlock", "bulk", etc.
-            if re.search(rf'\b{re.escape(sig)}\b', text):
-                return True
-        elif sig in text:
-            return True
-    return False
+    if _LONG_NON_US_PATTERN.search(text):
+        return True
+    return _SHORT_NON_US_PATTERN.search(text) is not None
@@ -4,14 +4,18 @@
 import logging
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
+import config
 from ai_scorer import score_top_jobs
 from archive import save_daily_report
 from dashboard import generate_dashboard
-from dedup import init_db, is_duplicate, mark_as_sent, was_previously_sent
+from dedup import dedupe, init_db, mark_as_sent_batch, reset_db, was_previously_sent_batch
 from filters import passes_hard_filters
-from models import JobListing
-from scorer import rule_based_score
+from models import DESCRIPTION_MAX_CHARS, JobListing
+from scorer import rule_based_scores
 from sources.builtin import BuiltInSource
 from sources.crowdstrike import CrowdStrikeSource
 from sources.greenhouse import GreenhouseSource
@@ -29,8 +33,22 @@ logger = logging.getLogger(__name__)
 DB_PATH = os.path.join("data", "seen_jobs.db") if os.path.isdir("data") else "seen_jobs.db"
 
 
-def run_pipeline():
-    """Execute the full job search pipeline."""
+def collect_all(sources: list) -> list[JobListing]:
+    """Collect from every source concurrently; results keep source order.
+
+    Sources spend nearly all their time waiting on the network, so threads
+    bring the phase down to roughly the slowest source instead of the sum.
+    """
+    with ThreadPoolExecutor(max_workers=len(sources) or 1) as pool:
+        results = list(pool.map(lambda source: source.safe_collect(), sources))
+    return [job for jobs in results for job in jobs]
+
+
+def run_pipeline(refresh: bool = False):
+    """Execute the full job search pipeline.
+
+    ``refresh`` re-scores every top job with Ollama instead of reusing cached AI scores.
+    """
 
     # --- Phase 0: Initialize ---
     init_db(DB_PATH)
@@ -46,9 +64,7 @@ def run_pipeline():
         LinkedInAlertsSource(),
     ]
 
-    raw_jobs = []
-    for source in sources:
-        raw_jobs.extend(source.safe_collect())
+    raw_jobs = collect_all(sources)
 
     logger.info(f"Collected {len(raw_jobs)} raw listings from {len(sources)} sources")
 
@@ -62,18 +78,17 @@ def run_pipeline():
     logger.info("=== Phase 2: FILTER & DEDUPLICATE ===")
 
     # Hard filters
-    filtered = [job for job in raw_jobs if passes_hard_filters(job)]
+    now = time.time()
+    filtered = [job for job in raw_jobs if passes_hard_filters(job, now)]
     logger.info(f"After hard filters: {len(filtered)} of {len(raw_jobs)} remain")
 
     # Cross-source dedup
-    unique = []
-    for job in filtered:
-        if not is_duplicate(job, unique):
-            unique.append(job)
+    unique = dedupe(filtered)
     logger.info(f"After dedup: {len(unique)} unique listings")
 
     # Remove previously sent
-    new_jobs = [job for job in unique if not was_previously_sent(job, DB_PATH)]
+    sent = was_previously_sent_batch(unique, DB_PATH)
+    new_jobs = [job for job, was_sent in zip(unique, sent) if not was_sent]
     logger.info(f"After seen-check: {len(new_jobs)} new listings")
 
     if not new_jobs:
@@ -85,13 +100,17 @@ def run_pipeline():
     # --- Phase 3: Score & Rank ---
     logger.info("=== Phase 3: SCORE (rule-based) ===")
 
-    rule_scores = [rule_based_score(job) for job in new_jobs]
+    rule_scores = rule_based_scores(new_jobs)
 
     logger.info("=== Phase 3b: SCORE (AI) ===")
-    ai_results = score_top_jobs(new_jobs, rule_scores, top_n=15)
+    ai_results = score_top_jobs(
+        new_jobs, rule_scores, top_n=15, cache_path=DB_PATH, refresh=refresh,
+        min_rule_score=config.MIN_RULE_SCORE,
+    )
 
-    # Combine into final scored list
+    # Combine into final scored list; keep (job, score) pairs for the seen DB
     scored_jobs = []
+    delivered = []
     for job, r_score, ai_result in zip(new_jobs, rule_scores, ai_results):
         if ai_result and ai_result.get("fit_score"):
             total_score = r_score + ai_result["fit_score"]
@@ -123,14 +142,16 @@ def run_pipeline():
             "salary_max": job.salary_max,
             "location": job.location,
             "posted_date": job.posted_date.isoformat(),
-            "description": job.description[:3000],
+            "description": job.description[:DESCRIPTION_MAX_CHARS],
             "summary": summary,
             "key_matches": key_matches,
             "gaps": gaps,
         })
+        delivered.append((job, total_score))
 
-    # Sort by score descending
-    scored_jobs.sort(key=lambda j: j["score"], reverse=True)
+    # Sort by score descending. Every job is marked seen below, so the report
+    # and dashboard list all of them; a top-N cut would drop jobs for good.
+    scored_jobs.sort(key=itemgetter("score"), reverse=True)
 
     high = sum(1 for j in scored_jobs if j["priority"] == "high")
     med = sum(1 for j in scored_jobs if j["priority"] == "medium")
@@ -148,14 +169,7 @@ def run_pipeline():
     logger.info(f"Dashboard saved to {dash}")
 
     # Mark all delivered jobs as seen
-    for job_data in scored_jobs:
-        stub = JobListing(
-            title=job_data["title"],
-            company=job_data["company"],
-            url=job_data["url"],
-            source=job_data["source"],
-        )
-        mark_as_sent(stub, score=job_data["score"], db_path=DB_PATH)
+    mark_as_sent_batch(delivered, DB_PATH)
 
     logger.info(f"Marked {len(scored_jobs)} jobs as seen in database")
     logger.info("=== Pipeline complete ===")
@@ -184,7 +198,6 @@ def serve_dashboard(port: int = 8080):
     import threading
     import webbrowser
 
-    import config
     from dashboard import generate_landing_page
     from user_profile import PROFILE_PATH, reload_profile
 
@@ -202,7 +215,12 @@ def serve_dashboard(port: int = 8080):
             super().__init__(*args, directory=reports_dir, **kwargs)
 
         def end_headers(self):
-            self.send_header("Cache-Control", "no-store")
+            # The stylesheet may be cached but must be revalidated (304 via
+            # If-Modified-Since); pages and API responses are never stored.
+            if self.path.endswith(".css"):
+                self.send_header("Cache-Control", "no-cache")
+            else:
+                self.send_header("Cache-Control", "no-store")
             super().end_headers()
 
         def do_GET(self):
@@ -211,8 +229,35 @@ def serve_dashboard(port: int = 8080):
             elif self.path == "/api/reports":
                 self._handle_list_reports()
                 return
+            if self._send_gzipped_page():
+                return
             super().do_GET()
 
+        def _send_gzipped_page(self):
+            """Serve the precompressed .html.gz sibling of a page if the client accepts gzip."""
+            if not self.path.endswith(".html"):
+                return False
+            if "gzip" not in self.headers.get("Accept-Encoding", ""):
+                return False
+            page = self.translate_path(self.path)
+            gz_path = page + ".gz"
+            try:
+                # A stale sibling (page rewritten without it) falls back to the plain file
+                if os.path.getmtime(gz_path) < os.path.getmtime(page):
+                    return False
+                with open(gz_path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                return False
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return True
+
         def _handle_list_reports(self):
             """Return a JSON list of available HTML report files."""
             import glob as _glob
@@ -316,6 +361,8 @@ def serve_dashboard(port: int = 8080):
             for key in ("min", "max", "floor"):
                 if key in sr and not isinstance(sr[key], (int, float)):
                     return False
+            if not isinstance(data.get("min_rule_score", 0), (int, float)):
+                return False
             # Field size limits
             summary = data.get("resume_summary", "")
             if isinstance(summary, str) and len(summary) > 10000:
@@ -329,14 +376,87 @@ def serve_dashboard(port: int = 8080):
                     return False
             return True
 
+        _PROGRESS_WINDOW = 0.05  # seconds to coalesce progress messages
+        _progress_lock = None
+        _progress_timer = None
+
+        def _start_stream(self):
+            """Send progress stream headers and reset the progress buffer.
+
+            Each streamed line starts with a one-letter tag: ``P <text>`` for
+            progress, ``R <json>`` for the result and ``E <json>`` for an error.
+            The R or E line is always the last one; call ``_end_stream`` once
+            the handler is done.
+            """
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("X-Content-Type-Options", "nosniff")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self._progress_lock = threading.Lock()
+            self._progress_pending = []
+            self._stream_closed = False
+
         def _send_progress(self, message):
-            """Send a progress line as NDJSON."""
-            line = _json.dumps({"type": "progress", "message": message}) + "\n"
+            """Queue a progress message; batches go out every _PROGRESS_WINDOW."""
+            with self._progress_lock:
+                if self._stream_closed:
+                    return
+                self._progress_pending.append(message)
+                if self._progress_timer is None:
+                    self._progress_timer = threading.Timer(
+                        self._PROGRESS_WINDOW, self._flush_progress
+                    )
+                    self._progress_timer.daemon = True
+                    self._progress_timer.start()
+
+        def _flush_progress(self):
+            """Timer callback: write the progress queued during the last window."""
+            with self._progress_lock:
+                self._write_pending_progress()
+
+        def _write_pending_progress(self):
+            """Write queued progress messages as raw-text ``P`` lines in one write.
+
+            Cancels the batching timer; the caller holds ``_progress_lock``.
+            """
+            if self._progress_timer is not None:
+                self._progress_timer.cancel()
+                self._progress_timer = None
+            messages, self._progress_pending = self._progress_pending, []
+            if not messages or self._stream_closed:
+                return
+            lines = "".join(
+                f"P {part}\n" for message in messages for part in message.splitlines()
+            )
             try:
-                self.wfile.write(line.encode())
+                self.wfile.write(lines.encode())
+                self.wfile.flush()
+            except (OSError, ValueError):
+                pass  # Client disconnected or the response is already closed
+
+        def _send_tagged(self, tag, payload):
+            """Flush pending progress, then write the final tagged JSON line."""
+            with self._progress_lock:
+                self._write_pending_progress()
+                self._stream_closed = True
+                self.wfile.write(f"{tag} {_json.dumps(payload)}\n".encode())
                 self.wfile.flush()
-            except (BrokenPipeError, ConnectionResetError):
-                pass
+
+        def _end_stream(self):
+            """Flush or drop pending progress so no timer writes after the handler returns."""
+            if self._progress_lock is None:
+                return
+            with self._progress_lock:
+                self._write_pending_progress()
+                self._stream_closed = True
+
+        def _send_result(self, payload):
+            self._send_tagged("R", payload)
+
+        def _send_error(self, message):
+            self._send_tagged("E", {"error": message})
 
         def _handle_search(self):
             # Read profile from request body
@@ -373,12 +493,7 @@ def serve_dashboard(port: int = 8080):
 
             try:
                 # Start streaming response
-                self.send_response(200)
-                self.send_header("Content-Type", "application/x-ndjson")
-                self.send_header("X-Content-Type-Options", "nosniff")
-                self.send_header("Cache-Control", "no-cache")
-                self.send_header("Connection", "close")
-                self.end_headers()
+                self._start_stream()
 
                 root_logger.addHandler(stream_handler)
 
@@ -397,9 +512,7 @@ def serve_dashboard(port: int = 8080):
                         old_tags = set(old_profile.get("role_tags", []))
                         new_tags = set(profile_data.get("role_tags", []))
                         if old_tags != new_tags:
-                            db_path = os.path.join(project_dir, DB_PATH)
-                            if os.path.exists(db_path):
-                                os.remove(db_path)
+                            if reset_db(os.path.join(project_dir, DB_PATH)):
                                 self._send_progress("Role tags changed — cleared seen jobs database")
                     except (FileNotFoundError, _json.JSONDecodeError):
                         pass
@@ -415,20 +528,17 @@ def serve_dashboard(port: int = 8080):
                 scored_jobs = run_pipeline() or []
 
                 # Send final result
-                line = _json.dumps({"type": "result", "jobs": scored_jobs}) + "\n"
-                self.wfile.write(line.encode())
-                self.wfile.flush()
+                self._send_result({"jobs": scored_jobs})
 
             except Exception as e:
                 logger.error(f"Search pipeline failed: {e}", exc_info=True)
                 try:
-                    line = _json.dumps({"type": "error", "error": "Search pipeline failed"}) + "\n"
-                    self.wfile.write(line.encode())
-                    self.wfile.flush()
+                    self._send_error("Search pipeline failed")
                 except (BrokenPipeError, ConnectionResetError):
                     pass
             finally:
                 root_logger.removeHandler(stream_handler)
+                self._end_stream()
                 search_lock.release()
 
         def _handle_parse_resume(self):
@@ -497,31 +607,22 @@ def serve_dashboard(port: int = 8080):
                 self.wfile.write(b'{"error":"File too large (max 10 MB)"}')
                 return
 
-            # Stream NDJSON response
-            self.send_response(200)
-            self.send_header("Content-Type", "application/x-ndjson")
-            self.send_header("X-Content-Type-Options", "nosniff")
-            self.send_header("Cache-Control", "no-cache")
-            self.send_header("Connection", "close")
-            self.end_headers()
+            # Stream progress response
+            self._start_stream()
 
             try:
                 result = parse_resume(
                     file_bytes, filename, progress_callback=self._send_progress
                 )
-                line = _json.dumps({"type": "result", "profile": result}) + "\n"
-                self.wfile.write(line.encode())
-                self.wfile.flush()
+                self._send_result({"profile": result})
 
             except ValueError as e:
-                line = _json.dumps({"type": "error", "error": str(e)}) + "\n"
-                self.wfile.write(line.encode())
-                self.wfile.flush()
+                self._send_error(str(e))
             except Exception as e:
                 logger.error(f"Resume parsing failed: {e}", exc_info=True)
-                line = _json.dumps({"type": "error", "error": "Resume parsing failed"}) + "\n"
-                self.wfile.write(line.encode())
-                self.wfile.flush()
+                self._send_error("Resume parsing failed")
+            finally:
+                self._end_stream()
 
         def _handle_analyze_text(self):
             """Analyze pasted resume text and generate profile tags via Ollama."""
@@ -557,31 +658,22 @@ def serve_dashboard(port: int = 8080):
                 self.wfile.write(b'{"error":"No resume text provided"}')
                 return
 
-            # Stream NDJSON response
-            self.send_response(200)
-            self.send_header("Content-Type", "application/x-ndjson")
-            self.send_header("X-Content-Type-Options", "nosniff")
-            self.send_header("Cache-Control", "no-cache")
-            self.send_header("Connection", "close")
-            self.end_headers()
+            # Stream progress response
+            self._start_stream()
 
             try:
                 result = parse_resume_text(
                     text, progress_callback=self._send_progress
                 )
-                line = _json.dumps({"type": "result", "profile": result}) + "\n"
-                self.wfile.write(line.encode())
-                self.wfile.flush()
+                self._send_result({"profile": result})
 
             except ValueError as e:
-                line = _json.dumps({"type": "error", "error": str(e)}) + "\n"
-                self.wfile.write(line.encode())
-                self.wfile.flush()
+                self._send_error(str(e))
             except Exception as e:
                 logger.error(f"Text analysis failed: {e}", exc_info=True)
-                line = _json.dumps({"type": "error", "error": "Resume analysis failed"}) + "\n"
-                self.wfile.write(line.encode())
-                self.wfile.flush()
+                self._send_error("Resume analysis failed")
+            finally:
+                self._end_stream()
 
         def log_message(self, format, *args):
             # Suppress GET logs for cleaner output
@@ -621,7 +713,7 @@ if __name__ == "__main__":
         serve_dashboard(port)
     else:
         try:
-            run_pipeline()
+            run_pipeline(refresh="--refresh" in sys.argv[1:])
         except KeyboardInterrupt:
             logger.info("Pipeline interrupted by user")
             sys.exit(1)
@@ -1,5 +1,10 @@
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cached_property
+
+# Longest description carried past collection. The pipeline trims once when
+# building ranked results so the dashboard and AI prompt reuse the same string.
+DESCRIPTION_MAX_CHARS = 3000
 
 
 @dataclass
@@ -15,3 +20,25 @@ class JobListing:
     is_remote: bool = False
     posted_date: datetime = field(default_factory=datetime.now)
     raw_data: dict = field(default_factory=dict)
+
+    # Lowercased views shared by the filters and scorer, computed on first use.
+    # Listings aren't mutated after collection, so these never go stale.
+    @cached_property
+    def title_lower(self) -> str:
+        return self.title.lower()
+
+    @cached_property
+    def location_lower(self) -> str:
+        return self.location.lower()
+
+    @cached_property
+    def description_lower(self) -> str:
+        return self.description.lower()
+
+    @cached_property
+    def posted_ts(self) -> float:
+        """posted_date as epoch seconds; naive datetimes are taken as UTC."""
+        posted = self.posted_date
+        if posted.tzinfo is None:
+            posted = posted.replace(tzinfo=timezone.utc)
+        return posted.timestamp()
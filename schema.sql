@@ -9,3 +9,11 @@ CREATE TABLE IF NOT EXISTS seen_jobs (
     score REAL DEFAULT 0,
     status TEXT DEFAULT 'new'  -- new, applied, skipped, interviewing
 );
+
+CREATE INDEX IF NOT EXISTS idx_seen_company_hash ON seen_jobs(company, title_hash);
+
+CREATE TABLE IF NOT EXISTS ai_scores (
+    key TEXT PRIMARY KEY,  -- blake2b of job url + model + prompt template + resume
+    result TEXT,           -- AI result dict as JSON
+    scored_at DATE DEFAULT CURRENT_DATE
+);
@@ -1,46 +1,79 @@
+from dataclasses import dataclass
+
 import config as config
 from models import JobListing
 from user_profile import get_profile
 
 
+@dataclass(frozen=True)
+class _ScoringTerms:
+    """Lowercased profile keywords and salary bands, built once per batch."""
+
+    primary_titles: tuple[str, ...]
+    secondary_titles: tuple[str, ...]
+    priority_companies: tuple[str, ...]
+    industry_keywords: tuple[str, ...]
+    alignment_keywords: tuple[str, ...]
+    salary_target: int
+    salary_acceptable: int
+
+    @classmethod
+    def from_profile(cls, p: dict) -> "_ScoringTerms":
+        scoring = p.get("scoring", {})
+        salary_target = p["salary_range"]["min"]
+        return cls(
+            primary_titles=tuple(t.lower() for t in scoring.get("primary_role_tags", [])),
+            secondary_titles=tuple(t.lower() for t in scoring.get("secondary_role_tags", [])),
+            priority_companies=tuple(c.lower() for c in config.PRIORITY_COMPANIES),
+            industry_keywords=tuple(t.lower() for t in p["industry_tags"]),
+            alignment_keywords=tuple(s.lower() for s in p.get("skills", [])),
+            salary_target=salary_target,
+            salary_acceptable=int(salary_target * 0.85),
+        )
+
+
 def rule_based_score(job: JobListing) -> float:
     """Score 0-50 based on hard criteria. Fast, no API cost."""
+    return rule_based_scores([job])[0]
+
+
+def rule_based_scores(jobs: list[JobListing]) -> list[float]:
+    """Score many jobs, lowercasing the profile's keyword lists only once."""
+    terms = _ScoringTerms.from_profile(get_profile())
+    return [_score(job, terms) for job in jobs]
+
+
+def _score(job: JobListing, terms: _ScoringTerms) -> float:
     score = 0.0
-    p = get_profile()
 
-    title_lower = job.title.lower()
-    desc_lower = job.description.lower()
+    title_lower = job.title_lower
+    desc_lower = job.description_lower
 
     # Title match (0-15 points)
-    primary_titles = [t.lower() for t in p.get("scoring", {}).get("primary_role_tags", [])]
-    secondary_titles = [t.lower() for t in p.get("scoring", {}).get("secondary_role_tags", [])]
-    if any(t in title_lower for t in primary_titles):
+    if any(t in title_lower for t in terms.primary_titles):
         score += 15
-    elif any(t in title_lower for t in secondary_titles):
+    elif any(t in title_lower for t in terms.secondary_titles):
         score += 10
     else:
         score += 5
 
     # Priority company (0-10 points)
-    if any(c.lower() in job.company.lower() for c in config.PRIORITY_COMPANIES):
+    company_lower = job.company.lower()
+    if any(c in company_lower for c in terms.priority_companies):
         score += 10
 
     # Industry match (0-10 points)
-    industry_keywords = [t.lower() for t in p["industry_tags"]]
-    matches = sum(1 for kw in industry_keywords if kw in desc_lower)
+    matches = sum(1 for kw in terms.industry_keywords if kw in desc_lower)
     score += min(matches * 2.5, 10)
 
     # Salary range (0-10 points)
-    salary_target = p["salary_range"]["min"]
-    salary_acceptable = int(salary_target * 0.85)
-    if job.salary_min >= salary_target:
+    if job.salary_min >= terms.salary_target:
         score += 10
-    elif job.salary_min >= salary_acceptable:
+    elif job.salary_min >= terms.salary_acceptable:
         score += 5
 
     # Experience alignment signals (0-5 points)
-    alignment_keywords = [s.lower() for s in p.get("skills", [])]
-    alignment = sum(1 for kw in alignment_keywords if kw in desc_lower)
+    alignment = sum(1 for kw in terms.alignment_keywords if kw in desc_lower)
     score += min(alignment, 5)
 
     return score
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
@@ -10,17 +11,21 @@ from sources.base import BaseSource
 logger = logging.getLogger(__name__)
 
 API_BASE = "https://boards-api.greenhouse.io/v1/boards/{board}/jobs"
+MAX_BOARD_WORKERS = 8
 
 
 class GreenhouseSource(BaseSource):
     name = "greenhouse"
 
     def collect(self) -> list[JobListing]:
-        all_jobs = []
-        for company, board_token in config.GREENHOUSE_BOARDS.items():
-            jobs = self._fetch_board(company, board_token)
-            all_jobs.extend(jobs)
-        return all_jobs
+        boards = list(config.GREENHOUSE_BOARDS.items())
+        if not boards:
+            return []
+        # Boards are independent API calls; fetch them concurrently. A failing
+        # board still fails the whole source, as it did when fetched serially.
+        with ThreadPoolExecutor(max_workers=min(MAX_BOARD_WORKERS, len(boards))) as pool:
+            results = pool.map(lambda board: self._fetch_board(*board), boards)
+            return [job for jobs in results for job in jobs]
 
     def _fetch_board(self, company: str, board_token: str) -> list[JobListing]:
         url = API_BASE.format(board=board_token)
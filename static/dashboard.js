@@ -0,0 +1,1101 @@
+// Elements touched on hot paths (every keystroke, every streamed progress line),
+// looked up once; the script runs after the page body has been parsed.
+const els = {
+  searchBox: document.getElementById('searchBox'),
+  filterCount: document.getElementById('filterCount'),
+  statTotal: document.getElementById('statTotal'),
+  statHigh: document.getElementById('statHigh'),
+  statMed: document.getElementById('statMed'),
+  statLow: document.getElementById('statLow'),
+  progressPanel: document.getElementById('progressPanel'),
+  resumeProgress: document.getElementById('resumeProgress'),
+  analyzeTextProgress: document.getElementById('analyzeTextProgress'),
+  tableWrap: document.querySelector('.table-wrap'),
+};
+
+// --- Profile Management ---
+function getProfile() {
+  const stored = localStorage.getItem('autojobsearch_profile');
+  if (stored) {
+    try { return JSON.parse(stored); }
+    catch(e) { console.warn('Invalid stored profile, using default'); }
+  }
+  return JSON.parse(JSON.stringify(DEFAULT_PROFILE));
+}
+
+let currentProfile = getProfile();
+
+const TAG_FIELDS = {
+  roleTags: 'role_tags',
+  industryTags: 'industry_tags',
+  skillTags: 'skills',
+  companyTags: 'priority_companies'
+};
+
+function toggleProfile() {
+  const panel = document.getElementById('profilePanel');
+  const btn = document.getElementById('profileToggle');
+  const isVisible = panel.classList.toggle('visible');
+  btn.classList.toggle('active', isVisible);
+  if (isVisible) renderProfile();
+}
+
+function renderProfile() {
+  document.getElementById('resumeSummary').value = currentProfile.resume_summary || '';
+  document.getElementById('salaryMin').value = currentProfile.salary_range?.min || '';
+  document.getElementById('salaryMax').value = currentProfile.salary_range?.max || '';
+  document.getElementById('salaryFloor').value = currentProfile.salary_range?.floor || '';
+  document.getElementById('aiPrompt').value = currentProfile.ai_prompt_template || '';
+  for (const [elemId, key] of Object.entries(TAG_FIELDS)) {
+    renderTags(elemId, currentProfile[key] || []);
+  }
+}
+
+function renderTags(containerId, tags) {
+  const container = document.getElementById(containerId);
+  container.innerHTML = '';
+  tags.forEach((tag, i) => {
+    const pill = document.createElement('span');
+    pill.className = 'tag-pill';
+    const text = document.createTextNode(tag + ' ');
+    const rm = document.createElement('span');
+    rm.className = 'remove';
+    rm.textContent = '\u00d7';
+    rm.onclick = () => removeTag(containerId, i);
+    pill.appendChild(text);
+    pill.appendChild(rm);
+    container.appendChild(pill);
+  });
+  const input = document.createElement('input');
+  input.className = 'tag-add';
+  input.placeholder = 'Add...';
+  input.onkeydown = (e) => {
+    if (e.key === 'Enter' && e.target.value.trim()) {
+      e.preventDefault();
+      addTag(containerId, e.target.value.trim());
+      e.target.value = '';
+    }
+  };
+  container.appendChild(input);
+}
+
+function autoSaveProfile() {
+  localStorage.setItem('autojobsearch_profile', JSON.stringify(currentProfile));
+  fetch('/api/profile', {
+    method: 'PUT',
+    headers: {'Content-Type': 'application/json'},
+    body: JSON.stringify(currentProfile)
+  }).catch(() => {});
+}
+
+function addTag(containerId, value) {
+  const key = TAG_FIELDS[containerId];
+  if (!currentProfile[key]) currentProfile[key] = [];
+  if (!currentProfile[key].includes(value)) {
+    currentProfile[key].push(value);
+    renderTags(containerId, currentProfile[key]);
+    autoSaveProfile();
+  }
+  // Re-focus the input so the user can keep typing
+  const input = document.getElementById(containerId).querySelector('.tag-add');
+  if (input) input.focus();
+}
+
+function removeTag(containerId, index) {
+  const key = TAG_FIELDS[containerId];
+  if (currentProfile[key]) {
+    currentProfile[key].splice(index, 1);
+    renderTags(containerId, currentProfile[key]);
+    autoSaveProfile();
+  }
+}
+
+function clearTags(containerId) {
+  const key = TAG_FIELDS[containerId];
+  currentProfile[key] = [];
+  renderTags(containerId, []);
+  autoSaveProfile();
+}
+
+function readProfileFromUI() {
+  currentProfile.resume_summary = document.getElementById('resumeSummary').value;
+  currentProfile.ai_prompt_template = document.getElementById('aiPrompt').value;
+  currentProfile.salary_range = {
+    min: parseInt(document.getElementById('salaryMin').value) || 0,
+    max: parseInt(document.getElementById('salaryMax').value) || 0,
+    floor: parseInt(document.getElementById('salaryFloor').value) || 0,
+  };
+  // Tags are already updated live via addTag/removeTag
+}
+
+function saveProfile() {
+  readProfileFromUI();
+  localStorage.setItem('autojobsearch_profile', JSON.stringify(currentProfile));
+  showToast('Profile saved to browser');
+}
+
+function downloadProfile() {
+  readProfileFromUI();
+  const blob = new Blob([JSON.stringify(currentProfile, null, 2)], {type: 'application/json'});
+  const url = URL.createObjectURL(blob);
+  const a = document.createElement('a');
+  a.href = url;
+  a.download = 'profile.json';
+  a.click();
+  URL.revokeObjectURL(url);
+}
+
+function resetProfile() {
+  localStorage.removeItem('autojobsearch_profile');
+  currentProfile = JSON.parse(JSON.stringify(DEFAULT_PROFILE));
+  renderProfile();
+  showToast('Profile reset to defaults');
+}
+
+function showToast(msg) {
+  const t = document.getElementById('toast');
+  t.textContent = msg;
+  t.classList.add('show');
+  setTimeout(() => t.classList.remove('show'), 2500);
+}
+
+// --- Resume Upload ---
+document.getElementById('resumeFileInput').addEventListener('change', handleResumeUpload);
+
+// --- Progress streaming ---
+// Yields each message of a streamed response as it arrives. Every line starts
+// with a one-letter tag: "P <text>" is a progress line sent as raw text, so
+// it needs no JSON.parse; "R <json>" and "E <json>" carry the result or the
+// error. Progress lines from the same chunk are yielded together as one
+// {type: 'progress', messages} batch. Plain NDJSON lines (starting with "{")
+// are still accepted. Partial lines are kept as a list of pieces and joined
+// once complete, so a long line spread over many chunks isn't re-concatenated
+// per chunk. Malformed lines are skipped.
+const STREAM_TAGS = {R: 'result', E: 'error'};
+
+async function* streamMessages(resp) {
+  const reader = resp.body.pipeThrough(new TextDecoderStream()).getReader();
+  let pending = [];
+  let progress = [];
+  const parse = line => {
+    const tag = line[0];
+    if (tag === 'P') {
+      progress.push(line.slice(2));
+      return null;
+    }
+    try {
+      if (tag === '{') return JSON.parse(line);
+      const type = STREAM_TAGS[tag];
+      if (type) return Object.assign(JSON.parse(line.slice(2)), {type});
+    } catch(e) {}
+    return null;
+  };
+  const takeProgress = () => {
+    const batch = {type: 'progress', messages: progress};
+    progress = [];
+    return batch;
+  };
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    let start = 0, nl;
+    while ((nl = value.indexOf('\n', start)) !== -1) {
+      pending.push(value.slice(start, nl));
+      const msg = parse(pending.join(''));
+      pending = [];
+      start = nl + 1;
+      if (msg) {
+        if (progress.length) yield takeProgress();
+        yield msg;
+      }
+    }
+    if (start < value.length) pending.push(value.slice(start));
+    if (progress.length) yield takeProgress();
+  }
+  const msg = parse(pending.join(''));
+  if (progress.length) yield takeProgress();
+  if (msg) yield msg;
+}
+
+async function handleResumeUpload(event) {
+  const file = event.target.files[0];
+  if (!file) return;
+
+  const ext = file.name.split('.').pop().toLowerCase();
+  if (!['pdf', 'doc', 'docx'].includes(ext)) {
+    showUploadError('Unsupported file type. Upload a PDF or DOCX.');
+    return;
+  }
+  if (file.size > 10 * 1024 * 1024) {
+    showUploadError('File too large (max 10 MB)');
+    return;
+  }
+
+  const btn = document.getElementById('uploadResumeBtn');
+  const status = document.getElementById('uploadStatus');
+  const progressPanel = els.resumeProgress;
+
+  btn.disabled = true;
+  btn.textContent = 'Processing...';
+  status.textContent = '';
+  status.className = 'upload-status';
+  progressPanel.innerHTML = '';
+  progressPanel.classList.add('visible');
+
+  try {
+    addResumeProgressLine('Reading file...');
+    const base64 = await readFileAsBase64(file);
+    addResumeProgressLine('Uploading to server (' + (file.size / 1024).toFixed(0) + ' KB)...');
+
+    const resp = await fetch('/api/parse-resume', {
+      method: 'POST',
+      headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({ file: base64, filename: file.name })
+    });
+
+    if (!resp.ok && !resp.body) {
+      const err = await resp.json().catch(() => ({}));
+      showUploadError(err.error || 'Upload failed');
+      addResumeProgressLine(err.error || 'Upload failed', true);
+      btn.disabled = false;
+      btn.textContent = 'Upload Resume';
+      event.target.value = '';
+      return;
+    }
+
+    addResumeProgressLine('Processing resume (this may take a minute)...');
+
+    let profileResult = null;
+    for await (const msg of streamMessages(resp)) {
+      if (msg.type === 'progress') {
+        progressMessages(msg).forEach(m => addResumeProgressLine(m));
+      } else if (msg.type === 'result') {
+        profileResult = msg.profile;
+      } else if (msg.type === 'error') {
+        showUploadError(msg.error || 'Resume parsing failed');
+        addResumeProgressLine(msg.error || 'Failed', true);
+      }
+    }
+
+    if (profileResult) {
+      applyResumeProfile(profileResult);
+      addResumeProgressLine('Profile populated — review and save when ready', false, true);
+      status.textContent = 'Tags extracted — review below';
+    }
+
+  } catch(e) {
+    showUploadError('Upload failed: ' + e.message);
+    addResumeProgressLine('Failed: ' + e.message, true);
+  }
+
+  btn.disabled = false;
+  btn.textContent = 'Upload Resume';
+  event.target.value = '';
+}
+
+function readFileAsBase64(file) {
+  return new Promise((resolve, reject) => {
+    const reader = new FileReader();
+    reader.onload = () => resolve(reader.result);
+    reader.onerror = () => reject(new Error('Failed to read file'));
+    reader.readAsDataURL(file);
+  });
+}
+
+// --- Progress Panels ---
+const MAX_PROGRESS_LINES = 200;
+const scrollPending = new Set();
+
+// Append to a progress panel, keeping only the newest MAX_PROGRESS_LINES
+// and scrolling to the bottom at most once per frame.
+function appendProgress(panel, node) {
+  panel.appendChild(node);
+  let excess = panel.childElementCount - MAX_PROGRESS_LINES;
+  while (excess-- > 0) panel.firstElementChild.remove();
+  if (!scrollPending.size) requestAnimationFrame(scrollProgressPanels);
+  scrollPending.add(panel);
+}
+
+function scrollProgressPanels() {
+  for (const panel of scrollPending) panel.scrollTop = panel.scrollHeight;
+  scrollPending.clear();
+}
+
+function addResumeProgressLine(msg, isError, isDone) {
+  const panel = els.resumeProgress;
+  const line = document.createElement('div');
+  line.className = 'rp-line';
+  if (isError) line.className += ' error';
+  if (isDone) line.className += ' done';
+  line.textContent = msg;
+  appendProgress(panel, line);
+}
+
+function showUploadError(msg) {
+  const status = document.getElementById('uploadStatus');
+  status.textContent = msg;
+  status.className = 'upload-status error';
+}
+
+function applyResumeProfile(profile) {
+  if (profile.resume_summary) {
+    currentProfile.resume_summary = profile.resume_summary;
+    document.getElementById('resumeSummary').value = profile.resume_summary;
+  }
+
+  if (profile.role_tags && profile.role_tags.length > 0) {
+    currentProfile.role_tags = profile.role_tags;
+    renderTags('roleTags', currentProfile.role_tags);
+  }
+  if (profile.industry_tags && profile.industry_tags.length > 0) {
+    currentProfile.industry_tags = profile.industry_tags;
+    renderTags('industryTags', currentProfile.industry_tags);
+  }
+  if (profile.skills && profile.skills.length > 0) {
+    currentProfile.skills = profile.skills;
+    renderTags('skillTags', currentProfile.skills);
+  }
+
+  if (!currentProfile.scoring) currentProfile.scoring = {};
+  if (profile.primary_role_tags && profile.primary_role_tags.length > 0) {
+    currentProfile.scoring.primary_role_tags = profile.primary_role_tags;
+  }
+  if (profile.secondary_role_tags && profile.secondary_role_tags.length > 0) {
+    currentProfile.scoring.secondary_role_tags = profile.secondary_role_tags;
+  }
+
+  autoSaveProfile();
+  showToast('Resume parsed — review your profile tags');
+}
+
+// --- Analyze Pasted Text ---
+async function analyzeResumeText() {
+  const text = document.getElementById('resumeSummary').value.trim();
+  if (!text) {
+    const s = document.getElementById('analyzeTextStatus');
+    s.textContent = 'Paste your resume text above first';
+    s.className = 'upload-status error';
+    return;
+  }
+
+  const btn = document.getElementById('analyzeTextBtn');
+  const status = document.getElementById('analyzeTextStatus');
+  const progressPanel = els.analyzeTextProgress;
+
+  btn.disabled = true;
+  btn.textContent = 'Analyzing...';
+  status.textContent = '';
+  status.className = 'upload-status';
+  progressPanel.innerHTML = '';
+  progressPanel.classList.add('visible');
+
+  addTextProgressLine('Sending text to server...');
+
+  try {
+    const resp = await fetch('/api/analyze-text', {
+      method: 'POST',
+      headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({ text: text })
+    });
+
+    if (!resp.ok && !resp.body) {
+      const err = await resp.json().catch(() => ({}));
+      status.textContent = err.error || 'Analysis failed';
+      status.className = 'upload-status error';
+      addTextProgressLine(err.error || 'Failed', true);
+      btn.disabled = false;
+      btn.textContent = 'Analyze Text';
+      return;
+    }
+
+    addTextProgressLine('Processing (this may take a minute)...');
+
+    let profileResult = null;
+    for await (const msg of streamMessages(resp)) {
+      if (msg.type === 'progress') {
+        progressMessages(msg).forEach(m => addTextProgressLine(m));
+      } else if (msg.type === 'result') {
+        profileResult = msg.profile;
+      } else if (msg.type === 'error') {
+        status.textContent = msg.error || 'Analysis failed';
+        status.className = 'upload-status error';
+        addTextProgressLine(msg.error || 'Failed', true);
+      }
+    }
+
+    if (profileResult) {
+      applyResumeProfile(profileResult);
+      addTextProgressLine('Tags populated — review and save when ready', false, true);
+      status.textContent = 'Tags extracted — review below';
+    }
+
+  } catch(e) {
+    status.textContent = 'Analysis failed: ' + e.message;
+    status.className = 'upload-status error';
+    addTextProgressLine('Failed: ' + e.message, true);
+  }
+
+  btn.disabled = false;
+  btn.textContent = 'Analyze Text';
+}
+
+function addTextProgressLine(msg, isError, isDone) {
+  const panel = els.analyzeTextProgress;
+  const line = document.createElement('div');
+  line.className = 'rp-line';
+  if (isError) line.className += ' error';
+  if (isDone) line.className += ' done';
+  line.textContent = msg;
+  appendProgress(panel, line);
+}
+
+// --- Run Search ---
+// Same wording as dashboard._format_age, which renders the server-side rows
+function formatAge(postedMs, nowMs = Date.now()) {
+  if (!postedMs) return '';
+  const ms = nowMs - postedMs;
+  const days = Math.floor(ms / 86400000);
+  if (days === 0) {
+    const hours = Math.floor(ms / 3600000);
+    return hours === 0 ? 'Just now' : hours + 'h ago';
+  }
+  if (days === 1) return '1 day ago';
+  if (days < 7) return days + ' days ago';
+  if (days < 14) return '1 week ago';
+  if (days < 30) return Math.floor(days / 7) + ' weeks ago';
+  if (days < 60) return '1 month ago';
+  return Math.floor(days / 30) + ' months ago';
+}
+
+function formatSalary(min, max) {
+  if (min && max) return '$' + min.toLocaleString() + '\u2013$' + max.toLocaleString();
+  if (min) return '$' + min.toLocaleString() + '+';
+  return '';
+}
+
+const PRIORITY_ORDER = Object.freeze({high: 0, medium: 1, low: 2});
+
+// Row models are the table's source of truth; the DOM only holds the rows in view.
+// idx is the job's position in jobData, which AI re-scoring reads from.
+function rowModelFromJob(job, idx, nowMs) {
+  const priority = job.priority in PRIORITY_ORDER ? job.priority : 'low';
+  const salMin = job.salary_min || 0;
+  const posted = job.posted_date || '';
+  const postedMs = Date.parse(posted) || 0;
+  return rowModel({
+    idx, score: job.score || 0, priority, url: job.url || '#', title: job.title || '',
+    company: job.company || '', salarySort: salMin,
+    salaryText: formatSalary(salMin, job.salary_max || 0), location: job.location || '',
+    posted, postedMs, ageText: formatAge(postedMs, nowMs), source: job.source || '',
+    summary: job.summary || ''
+  });
+}
+
+function rowModelFromDom(tr, idx) {
+  // Server-rendered rows are read once on load, then re-rendered from the model
+  const c = tr.children;
+  const link = c[2].querySelector('a');
+  return rowModel({
+    idx, score: parseFloat(c[0].dataset.sort) || 0, priority: tr.dataset.priority,
+    url: link ? link.getAttribute('href') : '#', title: c[2].textContent,
+    company: c[3].textContent, salarySort: parseFloat(c[4].dataset.sort) || 0,
+    salaryText: c[4].textContent, location: c[5].textContent, posted: tr.dataset.posted || '',
+    postedMs: Date.parse(tr.dataset.posted) || 0, ageText: c[6].textContent,
+    source: c[7].textContent, summary: c[8].textContent
+  });
+}
+
+function rowModel(m) {
+  // Filter keys are computed once here, not per keystroke
+  m.rescored = false;
+  m.text = searchText(m);
+  return m;
+}
+
+// Covers every visible cell, like matching the row's textContent did
+function searchText(m) {
+  return [
+    Math.round(m.score), m.priority, m.title, m.company, m.salaryText, m.location,
+    m.ageText, m.source, m.summary
+  ].join(' ').toLowerCase();
+}
+
+// Rows are cloned from the page's <template> and filled via textContent/dataset,
+// so no HTML is parsed per row and text needs no escaping.
+let rowTemplate = null;
+
+function safeUrl(url) {
+  return /^https?:\/\//i.test(url) ? url : '#';
+}
+
+function buildJobRow(m) {
+  if (!rowTemplate) rowTemplate = document.getElementById('jobRowTpl').content.firstElementChild;
+  const tr = rowTemplate.cloneNode(true);
+  const c = tr.children;
+  tr.dataset.priority = m.priority;
+  tr.dataset.posted = m.posted;
+  c[0].dataset.sort = m.score;
+  c[0].textContent = Math.round(m.score);
+  if (m.rescored) c[0].classList.add('rescored');
+  c[1].dataset.sort = PRIORITY_ORDER[m.priority] ?? 2;
+  c[1].className = 'priority-' + m.priority;
+  c[1].textContent = m.priority;
+  const link = c[2].firstElementChild;
+  link.href = safeUrl(m.url);
+  link.textContent = m.title;
+  c[3].textContent = m.company;
+  c[4].dataset.sort = m.salarySort;
+  c[4].textContent = m.salaryText;
+  c[5].textContent = m.location;
+  c[6].dataset.sort = m.posted;
+  c[6].textContent = m.ageText;
+  c[7].firstElementChild.textContent = m.source;
+  c[8].textContent = m.summary;
+  c[8].title = m.summary;
+  return tr;
+}
+
+// jobData holds the re-scoring inputs column-wise (one array per field), so
+// the salaries live in packed typed arrays rather than one object per job.
+function emptyJobColumns(n) {
+  return {
+    length: n,
+    title: new Array(n), company: new Array(n), description: new Array(n),
+    salary_min: new Float64Array(n), salary_max: new Float64Array(n), location: new Array(n)
+  };
+}
+
+function expandJobs(payload) {
+  // Rows reference the interned company/location tables by index
+  const { companies, locations, rows } = payload;
+  const cols = emptyJobColumns(rows.length);
+  rows.forEach((r, i) => {
+    cols.title[i] = r[0];
+    cols.company[i] = companies[r[1]];
+    cols.description[i] = r[2];
+    cols.salary_min[i] = r[3];
+    cols.salary_max[i] = r[4];
+    cols.location[i] = locations[r[5]];
+  });
+  return cols;
+}
+
+function loadResults(jobs) {
+
+  // Rebuild table
+  const wrap = els.tableWrap;
+  let table = document.getElementById('jobTable');
+  if (!table && jobs.length > 0) {
+    // Remove "no results" message and create table
+    wrap.innerHTML = `<table id="jobTable">
+      <thead><tr>
+        <th data-col="0">Score <span class="arrow"></span></th>
+        <th data-col="1">Priority <span class="arrow"></span></th>
+        <th data-col="2">Title <span class="arrow"></span></th>
+        <th data-col="3">Company <span class="arrow"></span></th>
+        <th data-col="4">Salary <span class="arrow"></span></th>
+        <th data-col="5">Location <span class="arrow"></span></th>
+        <th data-col="6">Posted <span class="arrow"></span></th>
+        <th data-col="7">Source <span class="arrow"></span></th>
+        <th>Summary</th>
+      </tr></thead><tbody></tbody></table>`;
+    table = document.getElementById('jobTable');
+  }
+
+  if (jobs.length === 0) {
+    wrap.innerHTML = "<p class='empty'>No new matching jobs found.</p>";
+    wrap.classList.remove('virtual');
+    Object.assign(jobData, emptyJobColumns(0));
+    allJobs = [];
+    order = new Int32Array(0);
+    viewIdx = order;
+    updateStatCounts();
+    return;
+  }
+
+  // One pass builds the re-scoring data, the row models and the stat counts
+  Object.assign(jobData, emptyJobColumns(jobs.length));
+  allJobs = [];
+  const counts = {high: 0, medium: 0, low: 0};
+  const nowMs = Date.now();
+  jobs.forEach((j, i) => {
+    jobData.title[i] = j.title || '';
+    jobData.company[i] = j.company || '';
+    jobData.description[i] = (j.description || '').substring(0, PROMPT_DESCRIPTION_CHARS);
+    jobData.salary_min[i] = j.salary_min || 0;
+    jobData.salary_max[i] = j.salary_max || 0;
+    jobData.location[i] = j.location || '';
+    const m = rowModelFromJob(j, i, nowMs);
+    counts[m.priority]++;
+    allJobs.push(m);
+  });
+  setStatCounts(counts, allJobs.length);
+
+  // Reset filters
+  currentPriority = 'all';
+  currentAge = 'all';
+  document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
+  document.querySelector('.filter-btn[data-priority="all"]').classList.add('active');
+  document.querySelectorAll('.age-btn').forEach(b => b.classList.remove('active'));
+  document.querySelector('.age-btn[data-age="all"]').classList.add('active');
+  els.searchBox.value = '';
+  wrap.scrollTop = 0;
+  resetOrder();
+}
+
+// Progress arrives batched as {messages: [...]}; accept the single form too.
+function progressMessages(msg) {
+  return msg.messages || [msg.message];
+}
+
+function addProgressLines(msgs) {
+  const panel = els.progressPanel;
+  const frag = document.createDocumentFragment();
+  for (const msg of msgs) {
+    const line = document.createElement('div');
+    line.className = 'progress-line';
+    // Highlight phases and AI scoring lines
+    if (msg.includes('Phase') || msg.includes('===')) line.className += ' phase';
+    else if (msg.includes('AI scored')) line.className += ' ai';
+    else if (msg.includes('Pipeline complete')) line.className += ' done';
+    line.textContent = msg;
+    frag.appendChild(line);
+  }
+  appendProgress(panel, frag);
+}
+
+function addProgressLine(msg) {
+  addProgressLines([msg]);
+}
+
+async function runSearch() {
+  const btn = document.getElementById('runSearchBtn');
+  const status = document.getElementById('searchStatus');
+  const panel = els.progressPanel;
+  btn.disabled = true;
+  btn.textContent = 'Searching...';
+  status.textContent = '';
+  panel.innerHTML = '';
+  panel.classList.add('visible');
+
+  try {
+    readProfileFromUI();
+    localStorage.setItem('autojobsearch_profile', JSON.stringify(currentProfile));
+
+    const resp = await fetch('/api/search', {
+      method: 'POST',
+      headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify(currentProfile)
+    });
+
+    if (resp.status === 409) {
+      status.textContent = 'Search already in progress';
+      btn.disabled = false;
+      btn.textContent = 'Run Search';
+      return;
+    }
+
+    // Read streaming progress response
+    let resultJobs = null;
+    for await (const msg of streamMessages(resp)) {
+      if (msg.type === 'progress') {
+        addProgressLines(progressMessages(msg));
+      } else if (msg.type === 'result') {
+        resultJobs = msg.jobs || [];
+      } else if (msg.type === 'error') {
+        addProgressLine('ERROR: ' + (msg.error || 'Pipeline failed'));
+        const errLine = panel.lastChild;
+        if (errLine) errLine.className = 'progress-line error';
+      }
+    }
+
+    if (resultJobs !== null) {
+      loadResults(resultJobs);
+      const count = resultJobs.length;
+      addProgressLine(count > 0 ? 'Done — ' + count + ' results loaded' : 'Done — no new results');
+      if (panel.lastChild) panel.lastChild.className = 'progress-line done';
+      status.textContent = count > 0 ? count + ' results' : 'No new results';
+      // Auto-hide progress after a delay
+      setTimeout(() => { panel.classList.remove('visible'); }, 8000);
+    }
+  } catch(e) {
+    addProgressLine('Failed: ' + e.message);
+    if (panel.lastChild) panel.lastChild.className = 'progress-line error';
+    status.textContent = 'Failed';
+  }
+  btn.disabled = false;
+  btn.textContent = 'Run Search';
+}
+
+let currentPriority = 'all';
+let currentAge = 'all';
+let sortCol = 0, sortAsc = false;
+
+// Windowed table state: allJobs holds every row model, order is the current sort
+// (indices into allJobs) and viewIdx the filtered subset of order that is shown.
+let allJobs = [];
+let order = new Int32Array(0);
+let viewIdx = order;
+const VIRTUAL_MIN_ROWS = 200;  // below this every row is mounted as before
+const WINDOW_BUFFER = 10;      // extra rows mounted above and below the viewport
+let rowHeight = 42;            // re-measured from the first rendered window
+let rowHeightMeasured = false;
+let scrollQueued = false;
+
+// --- Ollama model loading ---
+async function loadModels() {
+  const sel = document.getElementById('modelSelect');
+  const status = document.getElementById('ollamaStatus');
+  const btn = document.getElementById('rescoreBtn');
+  try {
+    const resp = await fetch(OLLAMA_URL + '/api/tags');
+    const data = await resp.json();
+    const models = data.models || [];
+    sel.replaceChildren(...models.map(m => {
+      const isDefault = m.name === DEFAULT_MODEL;
+      const label = (isDefault ? '✓ ' : '  ') + m.name;
+      return new Option(label, m.name, isDefault, isDefault);
+    }));
+    if (models.length > 0) {
+      btn.disabled = false;
+      const defaultFound = models.some(m => m.name === DEFAULT_MODEL);
+      status.textContent = defaultFound
+        ? DEFAULT_MODEL + ' (default)'
+        : models.length + ' models available';
+    } else {
+      sel.innerHTML = '<option value="">No models found</option>';
+      status.textContent = 'No models';
+    }
+  } catch(e) {
+    sel.innerHTML = '<option value="">Ollama not running</option>';
+    status.textContent = 'Ollama offline';
+    btn.disabled = true;
+  }
+}
+loadModels();
+renderProfile();
+
+// --- AI re-scoring ---
+// Only this much of a description goes into a prompt, so jobData keeps no more
+// (dashboard.py trims the embedded job data to the same length).
+const PROMPT_DESCRIPTION_CHARS = 2000;
+
+function buildPrompt(idx) {
+  readProfileFromUI();
+  const template = currentProfile.ai_prompt_template || '';
+  return template
+    .replaceAll('$resume_summary', currentProfile.resume_summary || '')
+    .replaceAll('$title', jobData.title[idx] || '')
+    .replaceAll('$company', jobData.company[idx] || '')
+    .replaceAll('$description', jobData.description[idx] || '')
+    .replaceAll('$salary_min', String(jobData.salary_min[idx] || 0))
+    .replaceAll('$salary_max', String(jobData.salary_max[idx] || 0))
+    .replaceAll('$location', jobData.location[idx] || '');
+}
+
+const RESCORE_CONCURRENCY = 4;
+
+async function scoreOne(row, model) {
+  if (row.idx >= jobData.length) return;
+  let result;
+  try {
+    const resp = await fetch(OLLAMA_URL + '/api/chat', {
+      method: 'POST',
+      headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({
+        model: model,
+        messages: [{role: 'user', content: buildPrompt(row.idx)}],
+        stream: false,
+        format: 'json'
+      })
+    });
+    const data = await resp.json();
+    // format: 'json' makes Ollama return bare JSON, no code fences to strip
+    result = JSON.parse(data.message.content);
+  } catch(e) {
+    console.warn('Score failed for row', row.idx, e);
+    return;
+  }
+
+  const baseScore = Math.min(row.score, 50);
+  const aiScore = Math.max(0, Math.min(50, parseInt(result.fit_score) || 0));
+  row.score = baseScore + aiScore;
+  row.rescored = true;
+  row.priority = result.priority in PRIORITY_ORDER ? result.priority : 'low';
+  if (result.summary) row.summary = result.summary;
+  row.text = searchText(row);
+  renderRows();
+}
+
+async function rescoreAll() {
+  const model = document.getElementById('modelSelect').value;
+  if (!model) return;
+  const btn = document.getElementById('rescoreBtn');
+  const progress = document.getElementById('ollamaProgress');
+  btn.disabled = true;
+  btn.textContent = 'Scoring...';
+
+  const toScore = allJobs.slice().sort((a, b) => b.score - a.score).slice(0, 15);
+
+  // Keep a few requests in flight; more would only queue up inside Ollama
+  const queue = toScore.slice();
+  let done = 0;
+  progress.textContent = `0/${toScore.length}`;
+  const worker = async () => {
+    while (queue.length) {
+      await scoreOne(queue.shift(), model);
+      done++;
+      progress.textContent = `${done}/${toScore.length}`;
+    }
+  };
+  await Promise.all(Array.from({length: RESCORE_CONCURRENCY}, worker));
+
+  sortCol = 0; sortAsc = false;
+  order.sort((a, b) => allJobs[b].score - allJobs[a].score);
+  filterTable();
+
+  updateStatCounts();
+  btn.disabled = false;
+  btn.textContent = 'Re-score with AI';
+  progress.textContent = 'Done';
+  setTimeout(() => { progress.textContent = ''; }, 3000);
+}
+
+function updateStatCounts() {
+  const counts = {high: 0, medium: 0, low: 0};
+  allJobs.forEach(j => counts[j.priority]++);
+  setStatCounts(counts, allJobs.length);
+}
+
+function setStatCounts(counts, total) {
+  els.statHigh.textContent = counts.high;
+  els.statMed.textContent = counts.medium;
+  els.statLow.textContent = counts.low;
+  els.statTotal.textContent = total;
+}
+
+// --- Filtering ---
+let filterQueued = false;
+function scheduleFilter() {
+  // Coalesce keystrokes into at most one filter pass per frame
+  if (filterQueued) return;
+  filterQueued = true;
+  requestAnimationFrame(() => {
+    filterQueued = false;
+    filterTable();
+  });
+}
+
+function filterTable() {
+  const q = els.searchBox.value.toLowerCase();
+  const maxAgeMs = currentAge === 'all' ? Infinity : parseInt(currentAge) * 86400000;
+  const cutoff = Date.now() - maxAgeMs;
+
+  viewIdx = order.filter(i => {
+    const job = allJobs[i];
+    if (q && !job.text.includes(q)) return false;
+    if (currentPriority !== 'all' && job.priority !== currentPriority) return false;
+    if (job.postedMs && job.postedMs < cutoff) return false;
+    return true;
+  });
+  renderRows();
+
+  if (q || currentPriority !== 'all' || currentAge !== 'all') {
+    els.filterCount.textContent = `Showing ${viewIdx.length} of ${allJobs.length}`;
+  } else {
+    els.filterCount.textContent = '';
+  }
+}
+
+// --- Windowed rendering ---
+// Large result sets mount only the rows in (and just around) the viewport, with
+// spacer rows standing in for the rest so the scrollbar still spans every row.
+function renderRows() {
+  const table = document.getElementById('jobTable');
+  if (!table) return;
+  const wrap = table.parentElement;
+  const tbody = table.tBodies[0];
+  const total = viewIdx.length;
+  const virtual = total >= VIRTUAL_MIN_ROWS;
+  table.classList.toggle('virtual', virtual);
+  wrap.classList.toggle('virtual', virtual);
+
+  let start = 0, end = total;
+  if (virtual) {
+    const first = Math.floor(wrap.scrollTop / rowHeight);
+    start = Math.max(0, first - WINDOW_BUFFER);
+    end = Math.min(total, first + Math.ceil(wrap.clientHeight / rowHeight) + WINDOW_BUFFER);
+  }
+
+  const frag = document.createDocumentFragment();
+  if (start > 0) frag.appendChild(spacerRow(start * rowHeight));
+  for (let i = start; i < end; i++) frag.appendChild(buildJobRow(allJobs[viewIdx[i]]));
+  if (end < total) frag.appendChild(spacerRow((total - end) * rowHeight));
+  tbody.replaceChildren(frag);
+
+  if (virtual && !rowHeightMeasured) {
+    const sample = tbody.querySelector('tr:not(.spacer)');
+    if (sample && sample.offsetHeight) {
+      rowHeightMeasured = true;
+      if (sample.offsetHeight !== rowHeight) {
+        rowHeight = sample.offsetHeight;
+        renderRows();
+      }
+    }
+  }
+}
+
+function spacerRow(height) {
+  const tr = document.createElement('tr');
+  tr.className = 'spacer';
+  const td = document.createElement('td');
+  td.colSpan = 9;
+  td.style.height = height + 'px';
+  tr.appendChild(td);
+  return tr;
+}
+
+function onTableScroll() {
+  if (scrollQueued || viewIdx.length < VIRTUAL_MIN_ROWS) return;
+  scrollQueued = true;
+  requestAnimationFrame(() => {
+    scrollQueued = false;
+    renderRows();
+  });
+}
+
+function resetOrder() {
+  order = Int32Array.from(allJobs, (_, i) => i);
+  filterTable();
+}
+
+function initTable() {
+  const wrap = els.tableWrap;
+  if (wrap) {
+    wrap.addEventListener('scroll', onTableScroll);
+    // One delegated listener covers the header even when loadResults rebuilds the table
+    wrap.addEventListener('click', e => {
+      const th = e.target.closest('th[data-col]');
+      if (th) sortTable(+th.dataset.col);
+    });
+  }
+  const table = document.getElementById('jobTable');
+  if (!table) return;
+  allJobs = Array.from(table.tBodies[0].rows, rowModelFromDom);
+  resetOrder();
+}
+
+function setPriority(p, btn) {
+  currentPriority = p;
+  document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
+  btn.classList.add('active');
+  document.querySelectorAll('.stat-card').forEach(c => c.classList.remove('active'));
+  const cardMap = {'all': '.stat-total', 'high': '.stat-high', 'medium': '.stat-med', 'low': '.stat-low'};
+  const card = document.querySelector(cardMap[p]);
+  if (card) card.classList.add('active');
+  filterTable();
+}
+
+function cardFilter(p) {
+  const btn = document.querySelector(`.filter-btn[data-priority="${p}"]`);
+  if (btn) setPriority(p, btn);
+}
+
+document.querySelector('.stats').addEventListener('click', e => {
+  const card = e.target.closest('.stat-card');
+  if (card) cardFilter(card.dataset.priority);
+});
+
+document.querySelector('.controls').addEventListener('click', e => {
+  const btn = e.target.closest('.filter-btn, .age-btn');
+  if (!btn) return;
+  if (btn.classList.contains('filter-btn')) setPriority(btn.dataset.priority, btn);
+  else setAge(btn.dataset.age, btn);
+});
+
+function setAge(age, btn) {
+  currentAge = age;
+  document.querySelectorAll('.age-btn').forEach(b => b.classList.remove('active'));
+  btn.classList.add('active');
+  filterTable();
+}
+
+// --- Sorting ---
+// Sort key per column, read from the row model with numeric fields already parsed
+const SORT_KEYS = [
+  j => j.score,
+  j => PRIORITY_ORDER[j.priority] ?? 2,
+  j => j.title.trim(),
+  j => j.company.trim(),
+  j => j.salarySort,
+  j => j.location.trim(),
+  j => j.postedMs,
+  j => j.source.trim(),
+];
+const textCollator = new Intl.Collator();
+
+function sortTable(col) {
+  if (sortCol === col) sortAsc = !sortAsc;
+  else { sortCol = col; sortAsc = true; }
+
+  // Extract each key once, then sort indices on the precomputed values
+  const keys = allJobs.map(SORT_KEYS[col]);
+  const dir = sortAsc ? 1 : -1;
+  const cmp = typeof keys[0] === 'number'
+    ? (a, b) => dir * (keys[a] - keys[b])
+    : (a, b) => dir * textCollator.compare(keys[a], keys[b]);
+  order.sort(cmp);
+  filterTable();
+
+  document.querySelectorAll('#jobTable th .arrow').forEach((a, i) => {
+    a.textContent = i === col ? (sortAsc ? '\u25B2' : '\u25BC') : '';
+  });
+}
+
+initTable();
+
+// --- Past Results ---
+let historyLoaded = false;
+function toggleHistory() {
+  const dd = document.getElementById('historyDropdown');
+  const isOpen = dd.classList.contains('visible');
+  if (isOpen) {
+    dd.classList.remove('visible');
+    return;
+  }
+  if (!historyLoaded) {
+    loadHistory();
+  }
+  dd.classList.add('visible');
+}
+
+async function loadHistory() {
+  const dd = document.getElementById('historyDropdown');
+  dd.innerHTML = '<div class="history-empty">Loading...</div>';
+  try {
+    const resp = await fetch('/api/reports');
+    const reports = await resp.json();
+    if (!reports.length) {
+      dd.innerHTML = '<div class="history-empty">No past results yet</div>';
+      return;
+    }
+    dd.innerHTML = '';
+    reports.forEach(r => {
+      const a = document.createElement('a');
+      a.href = '/' + r.filename;
+      a.textContent = r.label;
+      dd.appendChild(a);
+    });
+    historyLoaded = true;
+  } catch (e) {
+    dd.innerHTML = '<div class="history-empty">Failed to load reports</div>';
+  }
+}
+
+// Close dropdown when clicking outside
+document.addEventListener('click', function(e) {
+  const wrapper = document.querySelector('.history-wrapper');
+  if (wrapper && !wrapper.contains(e.target)) {
+    document.getElementById('historyDropdown').classList.remove('visible');
+  }
+});
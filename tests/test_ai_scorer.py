@@ -1,8 +1,10 @@
 """Tests for ai_scorer.py — AI scoring via Ollama."""
 
+import itertools
 import json
 from unittest.mock import patch
 
+import pytest
 import requests
 import responses
 
@@ -14,6 +16,14 @@ OLLAMA_URL = ai_scorer.OLLAMA_URL
 OLLAMA_MODEL = ai_scorer.OLLAMA_MODEL
 
 
+@pytest.fixture(autouse=True)
+def _reset_availability_cache(monkeypatch):
+    """Each test probes Ollama afresh and starts with every instance in rotation."""
+    monkeypatch.setattr(ai_scorer, "_available_until", 0.0)
+    monkeypatch.setattr(ai_scorer, "_live_urls", list(ai_scorer.OLLAMA_URLS))
+    monkeypatch.setattr(ai_scorer, "_endpoints", itertools.cycle(ai_scorer.OLLAMA_URLS))
+
+
 # --- _ollama_available ---
 
 
@@ -41,9 +51,46 @@ def test_ollama_available_false_no_model():
     assert _ollama_available() is False
 
 
+@responses.activate
+def test_ollama_available_loaded_model_skips_tags():
+    """Model already loaded per /api/ps → True without listing tags, then cached."""
+    responses.add(
+        responses.GET,
+        f"{OLLAMA_URL}/api/ps",
+        json={"models": [{"name": OLLAMA_MODEL}]},
+        status=200,
+    )
+    assert _ollama_available() is True
+    assert _ollama_available() is True
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_ollama_available_drops_dead_instances(monkeypatch):
+    """With several instances, only those serving the model stay in rotation."""
+    urls = ["http://localhost:11434", "http://localhost:11435"]
+    monkeypatch.setattr(ai_scorer, "OLLAMA_URLS", urls)
+    responses.add(
+        responses.GET,
+        f"{urls[1]}/api/tags",
+        json={"models": [{"name": OLLAMA_MODEL}]},
+        status=200,
+    )
+
+    assert _ollama_available() is True
+    assert ai_scorer._live_urls == [urls[1]]
+    assert {ai_scorer._next_url() for _ in range(3)} == {urls[1]}
+
+
+def test_trusted_url_rejects_remote_hosts():
+    """Only local Ollama addresses are accepted."""
+    assert ai_scorer._trusted_url(" http://localhost:11435/ ") == "http://localhost:11435"
+    assert ai_scorer._trusted_url("http://evil.example.com:11434") is None
+
+
 def test_ollama_available_connection_error():
     """Connection refused → False."""
-    with patch("ai_scorer.requests.get",
+    with patch("ai_scorer._session.get",
                side_effect=requests.exceptions.ConnectionError("Connection refused")):
         assert _ollama_available() is False
 
@@ -140,12 +187,62 @@ def test_ai_score_markdown_fences_stripped(make_job):
     assert result["fit_score"] == 30
 
 
+@responses.activate
+def test_ai_score_retries_transient_server_error(make_job):
+    """A 503 from a reloading Ollama is retried on the pooled session."""
+    responses.add(responses.POST, f"{OLLAMA_URL}/api/chat", status=503)
+    responses.add(
+        responses.POST,
+        f"{OLLAMA_URL}/api/chat",
+        json={"message": {"content": json.dumps({"fit_score": 20})}, "done": True},
+        status=200,
+    )
+
+    result = ai_score(make_job())
+
+    assert result["fit_score"] == 20
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_ai_score_streamed_reply_stops_at_closed_object(make_job):
+    """Streamed chunks are joined and reading stops once the JSON object closes."""
+    pieces = ['{"fit_score": 3', '5, "priority": "high"}', '\n\n\n']
+    body = "\n".join(
+        json.dumps({"message": {"content": p}, "done": False}) for p in pieces
+    ) + "\nnot json"
+    sent = []
+
+    def callback(request):
+        sent.append(json.loads(request.body))
+        return (200, {}, body)
+
+    responses.add_callback(responses.POST, f"{OLLAMA_URL}/api/chat", callback=callback)
+
+    result = ai_score(make_job())
+
+    assert result["fit_score"] == 35
+    assert result["priority"] == "high"
+    assert sent[0]["stream"] is True
+    assert sent[0]["options"]["num_predict"] == ai_scorer._NUM_PREDICT_PER_JOB
+    assert sent[0]["options"]["num_ctx"] == ai_scorer.OLLAMA_NUM_CTX
+    assert sent[0]["format"]["required"] == ["fit_score", "summary", "priority"]
+
+
+def test_job_fields_compacts_description(make_job):
+    """Control chars are dropped, whitespace collapsed, and length capped."""
+    job = make_job(description="Build\x00  data\n\n\tpipelines\x07 " + "x" * 5000)
+    desc = ai_scorer._job_fields(job)["description"]
+    assert desc.startswith("Build data pipelines x")
+    assert len(desc) == ai_scorer.DESCRIPTION_MAX_CHARS
+
+
 # --- score_top_jobs ---
 
 
 def test_score_top_jobs_ollama_unavailable(make_job):
     """Returns [None]*len(jobs) when Ollama is down."""
-    with patch("ai_scorer.requests.get",
+    with patch("ai_scorer._session.get",
                side_effect=requests.exceptions.ConnectionError("offline")):
         jobs = [make_job(), make_job()]
         rule_scores = [30.0, 20.0]
@@ -209,3 +306,142 @@ def test_custom_prompt_template(make_job, monkeypatch):
     request_body = json.loads(responses.calls[0].request.body)
     prompt = request_body["messages"][0]["content"]
     assert prompt.startswith("Custom:")
+
+
+def test_score_top_jobs_concurrent_results_keep_original_index(make_job):
+    """Results from concurrent scoring are mapped back to each job's index."""
+    jobs = [make_job(title=f"Job {i}") for i in range(4)]
+    rule_scores = [10.0, 40.0, 20.0, 30.0]
+
+    def fake_score(job, *args):
+        return {"fit_score": int(job.title.split()[-1]), "priority": "low"}
+
+    with patch("ai_scorer._ollama_available", return_value=True), \
+         patch("ai_scorer.ai_score", side_effect=fake_score):
+        results = score_top_jobs(jobs, rule_scores, top_n=3)
+
+    assert results[0] is None
+    assert [results[i]["fit_score"] for i in (1, 2, 3)] == [1, 2, 3]
+
+
+def test_score_top_jobs_skips_below_min_rule_score(make_job):
+    """Jobs under the rule-score floor are never sent to Ollama."""
+    jobs = [make_job(title="Strong"), make_job(title="Weak")]
+    result = {"fit_score": 30, "summary": "", "key_matches": [], "gaps": [], "priority": "medium"}
+
+    with patch("ai_scorer._ollama_available", return_value=True), \
+         patch("ai_scorer.ai_score", return_value=result) as mock_score:
+        results = score_top_jobs(jobs, [45.0, 12.0], top_n=2, min_rule_score=40)
+
+    assert results == [result, None]
+    assert mock_score.call_count == 1
+
+
+# --- ai_score_batch ---
+
+
+@responses.activate
+def test_ai_score_batch_returns_results_in_order(make_job):
+    """One request scores every job in the batch, results keep job order."""
+    batch = {"results": [
+        {"fit_score": 40, "summary": "First", "priority": "high"},
+        {"fit_score": 99, "summary": "Second", "priority": "medium"},
+    ]}
+    responses.add(
+        responses.POST,
+        f"{OLLAMA_URL}/api/chat",
+        json={"message": {"content": json.dumps(batch)}, "done": True},
+        status=200,
+    )
+
+    results = ai_scorer.ai_score_batch([make_job(title="A"), make_job(title="B")])
+
+    assert len(responses.calls) == 1
+    sent_format = json.loads(responses.calls[0].request.body)["format"]
+    assert sent_format["properties"]["results"]["maxItems"] == 2
+    assert [r["summary"] for r in results] == ["First", "Second"]
+    assert results[1]["fit_score"] == 50
+    assert results[0]["gaps"] == []
+
+
+@responses.activate
+def test_batch_wrong_length_falls_back_to_single(make_job, monkeypatch):
+    """A batch reply with the wrong number of results is re-scored per job."""
+    monkeypatch.setattr(ai_scorer, "OLLAMA_BATCH_SIZE", 2)
+    responses.add(
+        responses.GET,
+        f"{OLLAMA_URL}/api/tags",
+        json={"models": [{"name": OLLAMA_MODEL}]},
+        status=200,
+    )
+    short_batch = {"results": [{"fit_score": 10}]}
+    single = {"fit_score": 30, "summary": "", "key_matches": [], "gaps": [], "priority": "medium"}
+    responses.add(
+        responses.POST,
+        f"{OLLAMA_URL}/api/chat",
+        json={"message": {"content": json.dumps(short_batch)}, "done": True},
+        status=200,
+    )
+    for _ in range(2):
+        responses.add(
+            responses.POST,
+            f"{OLLAMA_URL}/api/chat",
+            json={"message": {"content": json.dumps(single)}, "done": True},
+            status=200,
+        )
+
+    jobs = [make_job(title="A"), make_job(title="B")]
+    results = score_top_jobs(jobs, [20.0, 10.0], top_n=2)
+
+    assert [r["fit_score"] for r in results] == [30, 30]
+
+
+# --- AI score cache ---
+
+
+def test_score_top_jobs_reuses_cached_scores(make_job, tmp_path):
+    """A job scored on an earlier run is served from the cache without Ollama."""
+    db = str(tmp_path / "seen.db")
+    jobs = [make_job(title="A", url="https://example.com/a")]
+    result = {"fit_score": 30, "summary": "ok", "key_matches": [], "gaps": [], "priority": "medium"}
+
+    with patch("ai_scorer._ollama_available", return_value=True), \
+         patch("ai_scorer.ai_score", return_value=result) as mock_score:
+        first = score_top_jobs(jobs, [10.0], top_n=1, cache_path=db)
+        second = score_top_jobs(jobs, [10.0], top_n=1, cache_path=db)
+        refreshed = score_top_jobs(jobs, [10.0], top_n=1, cache_path=db, refresh=True)
+
+    assert first == second == refreshed == [result]
+    assert mock_score.call_count == 2
+
+
+def test_refresh_on_fresh_db_stores_scores(make_job, tmp_path):
+    """A refresh run, which never reads the cache, still creates and fills it."""
+    from dedup import init_db
+
+    db = str(tmp_path / "seen.db")
+    init_db(db)
+    jobs = [make_job(url="https://example.com/a")]
+    result = {"fit_score": 30, "summary": "", "key_matches": [], "gaps": [], "priority": "medium"}
+
+    with patch("ai_scorer._ollama_available", return_value=True), \
+         patch("ai_scorer.ai_score", return_value=result) as mock_score:
+        assert score_top_jobs(jobs, [10.0], top_n=1, cache_path=db, refresh=True) == [result]
+        assert score_top_jobs(jobs, [10.0], top_n=1, cache_path=db) == [result]
+
+    assert mock_score.call_count == 1
+
+
+def test_score_cache_keyed_by_resume(make_job, tmp_path, monkeypatch):
+    """Changing the resume summary invalidates cached scores."""
+    db = str(tmp_path / "seen.db")
+    jobs = [make_job(url="https://example.com/a")]
+    result = {"fit_score": 30, "summary": "", "key_matches": [], "gaps": [], "priority": "medium"}
+
+    with patch("ai_scorer._ollama_available", return_value=True), \
+         patch("ai_scorer.ai_score", return_value=result) as mock_score:
+        score_top_jobs(jobs, [10.0], top_n=1, cache_path=db)
+        monkeypatch.setitem(ai_scorer.get_profile(), "resume_summary", "Different resume")
+        score_top_jobs(jobs, [10.0], top_n=1, cache_path=db)
+
+    assert mock_score.call_count == 2
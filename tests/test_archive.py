@@ -1,10 +1,11 @@
 """Tests for archive.py — markdown report generation."""
 
 import os
+from datetime import datetime, timezone
 
 from freezegun import freeze_time
 
-from archive import _format_posted, save_daily_report
+from archive import _fmt_salary, _format_posted, save_daily_report
 
 
 @freeze_time("2026-02-19 12:00:00", tz_offset=0)
@@ -87,3 +88,16 @@ def test_report_includes_job_details(tmp_path):
     assert "TestCorp" in content
     assert "greenhouse" in content
     assert "$130,000" in content
+
+
+def test_fmt_salary_variants():
+    """Range, open-ended minimum, and max-only salaries."""
+    assert _fmt_salary(130000, 150000) == "$130,000–$150,000"
+    assert _fmt_salary(130000, 0) == "$130,000+"
+    assert _fmt_salary(0, 150000) == ""
+
+
+def test_format_posted_uses_given_now_and_accepts_z_suffix():
+    """A caller-supplied `now` is used, and a trailing Z parses as UTC."""
+    now = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    assert _format_posted("2026-02-28T09:00:00Z", now) == "Yesterday"
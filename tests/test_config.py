@@ -66,3 +66,14 @@ def test_max_job_age_days_default(monkeypatch):
     monkeypatch.setattr(user_profile, "_profile", profile_no_age)
     config.reload()
     assert config.MAX_JOB_AGE_DAYS == 30
+
+
+def test_constants_load_lazily(monkeypatch):
+    """reload() defers reading the profile until a constant is accessed."""
+    import user_profile
+
+    config.reload()
+    assert "SALARY_MIN" not in vars(config)
+    monkeypatch.setitem(user_profile._profile["salary_range"], "min", 123000)
+    assert config.SALARY_MIN == 123000
+    assert "SALARY_MIN" in vars(config)
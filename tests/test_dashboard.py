@@ -4,7 +4,13 @@ import os
 
 from freezegun import freeze_time
 
-from dashboard import _format_age, _render_row, generate_dashboard
+from dashboard import (
+    _compile_template,
+    _format_age,
+    _jobs_payload,
+    _render_row,
+    generate_dashboard,
+)
 
 
 @freeze_time("2026-02-19 12:00:00", tz_offset=0)
@@ -54,6 +60,20 @@ def test_profile_embedded_as_json(tmp_path):
     assert "application support" in content
 
 
+@freeze_time("2026-02-19 12:00:00", tz_offset=0)
+def test_embedded_job_json_escapes_script_close(tmp_path):
+    """A </script> inside job data can't terminate the inline script block."""
+    jobs = [{"title": "CSM </script><script>alert(1)</script>", "company": "Café Co",
+             "priority": "high", "score": 40}]
+    filepath = generate_dashboard(jobs, output_dir=str(tmp_path))
+    with open(filepath, encoding="utf-8") as f:
+        content = f.read()
+    job_line = next(line for line in content.splitlines() if line.startswith("const jobData"))
+    assert "</script>" not in job_line
+    assert "<\\/script>" in job_line
+    assert "Café Co" in job_line
+
+
 def test_xss_prevention_priority():
     """Invalid priority value whitelisted to 'low'."""
     job = {
@@ -194,3 +214,97 @@ def test_past_results_js_included(tmp_path):
         content = f.read()
     assert "/api/reports" in content
     assert "loadHistory" in content
+
+
+def test_profile_json_reencoded_after_reload(monkeypatch):
+    """Cached profile JSON is reused until get_profile() returns a new dict."""
+    import dashboard
+    import user_profile
+
+    first = dashboard._profile_json()
+    assert dashboard._profile_json() is first
+
+    monkeypatch.setattr(user_profile, "_profile", {"role_tags": ["reloaded tag"]})
+    assert "reloaded tag" in dashboard._profile_json()
+
+
+@freeze_time("2026-02-19 12:00:00", tz_offset=0)
+def test_stylesheet_linked_and_published(tmp_path):
+    """Pages link dashboard.css, which is written once next to them."""
+    filepath = generate_dashboard([], output_dir=str(tmp_path))
+    with open(filepath, encoding="utf-8") as f:
+        content = f.read()
+    assert '<link rel="stylesheet" href="dashboard.css">' in content
+    assert "<style>" not in content
+    assert os.path.getsize(tmp_path / "dashboard.css") > 0
+
+
+@freeze_time("2026-02-19 12:00:00", tz_offset=0)
+def test_gzip_sibling_matches_page(tmp_path):
+    """A precompressed .html.gz is written alongside each page."""
+    import gzip
+
+    filepath = generate_dashboard([], output_dir=str(tmp_path))
+    with open(filepath, "rb") as f, gzip.open(filepath + ".gz", "rb") as gz:
+        assert gz.read() == f.read()
+
+
+@freeze_time("2026-02-19 12:00:00", tz_offset=0)
+def test_unchanged_inputs_skip_rerender(tmp_path):
+    """Same jobs and profile within the hour → the existing page is kept."""
+    jobs = [{"title": "CSM", "priority": "high", "score": 40}]
+    filepath = generate_dashboard(jobs, output_dir=str(tmp_path))
+    with open(filepath, "a") as f:
+        f.write("<!-- marker -->")
+
+    generate_dashboard(jobs, output_dir=str(tmp_path))
+    with open(filepath) as f:
+        assert f.read().endswith("<!-- marker -->")
+
+    generate_dashboard(jobs + [{"title": "TAM", "priority": "low"}], output_dir=str(tmp_path))
+    with open(filepath) as f:
+        assert "<!-- marker -->" not in f.read()
+
+
+def test_compile_template_splits_fields_and_unescapes():
+    """Literals and field names alternate; $$ becomes a literal dollar."""
+    parts = _compile_template("<b>$title</b> costs $$5 ${count}x")
+    assert parts == ("<b>", "title", "</b> costs $5 ", "count", "x")
+
+
+def test_jobs_payload_interns_companies_and_locations():
+    """Repeated companies/locations are stored once and referenced by index."""
+    jobs = [
+        {"title": "CSM", "company": "Acme", "location": "Remote"},
+        {"title": "TAM", "company": "Acme", "location": "Boston"},
+        {"title": "SE", "company": "Beta", "location": "Remote"},
+    ]
+    payload = _jobs_payload(jobs)
+    assert payload["companies"] == ["Acme", "Beta"]
+    assert payload["locations"] == ["Remote", "Boston"]
+    assert [r[1] for r in payload["rows"]] == [0, 0, 1]
+    assert [r[5] for r in payload["rows"]] == [0, 1, 0]
+
+
+def test_jobs_payload_trims_descriptions_to_prompt_length():
+    """Only the part of a description the browser prompt uses is embedded."""
+    payload = _jobs_payload([{"title": "CSM", "description": "x" * 5000}])
+    assert len(payload["rows"][0][2]) == 2000
+
+
+@freeze_time("2026-02-19 12:00:00", tz_offset=0)
+def test_reused_page_buffer_leaves_no_stale_tail(tmp_path):
+    """A small page rendered after a large one contains only its own bytes."""
+    big = [{"title": f"Job {i}", "priority": "high", "description": "x" * 500} for i in range(50)]
+    generate_dashboard(big, output_dir=str(tmp_path), filename="big.html")
+    small = generate_dashboard([], output_dir=str(tmp_path), filename="small.html")
+    with open(small, encoding="utf-8") as f:
+        content = f.read()
+    assert content.rstrip().endswith("</html>")
+    assert "Job 1" not in content
+
+
+def test_generate_leaves_no_temp_files(tmp_path):
+    """Pages are published by rename, so no .tmp files remain afterwards."""
+    generate_dashboard([{"title": "CSM", "priority": "high"}], output_dir=str(tmp_path))
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
@@ -1,9 +1,20 @@
 """Tests for dedup.py — deduplication logic."""
 
+import os
 import sqlite3
 from datetime import datetime, timezone
 
-from dedup import _stable_hash, init_db, is_duplicate, mark_as_sent, was_previously_sent
+from dedup import (
+    _stable_hash,
+    dedupe,
+    init_db,
+    is_duplicate,
+    mark_as_sent,
+    mark_as_sent_batch,
+    reset_db,
+    was_previously_sent,
+    was_previously_sent_batch,
+)
 
 
 # --- is_duplicate (fuzzy matching) ---
@@ -53,6 +64,26 @@ def test_threshold_boundary(make_job):
     assert is_duplicate(job, seen, threshold=100) is False
 
 
+def test_dedupe_keeps_first_of_each_cross_post(make_job):
+    """dedupe drops later fuzzy duplicates and preserves order."""
+    jobs = [
+        make_job(title="Customer Success Manager", company="TestCorp", url="https://a/1"),
+        make_job(title="Senior Software Engineer", company="BetaCorp", url="https://a/2"),
+        make_job(title="Customer Success Manager (Remote)", company="TestCorp", url="https://b/1"),
+        make_job(title="Customer Success Manager", company="ZetaIndustries", url="https://c/1"),
+    ]
+    assert [j.url for j in dedupe(jobs)] == ["https://a/1", "https://a/2", "https://c/1"]
+
+
+def test_dedupe_never_collapses_jobs_without_company(make_job):
+    """Empty fields score 0, so identical company-less listings are all kept."""
+    jobs = [
+        make_job(title="Customer Success Manager", company="", url=f"https://a/{i}")
+        for i in range(3)
+    ]
+    assert len(dedupe(jobs)) == 3
+
+
 # --- SQLite operations ---
 
 
@@ -105,6 +136,54 @@ def test_duplicate_by_title_hash(make_job, tmp_db):
     assert was_previously_sent(job2, tmp_db) is True
 
 
+def test_batch_check_matches_url_and_title_hash(make_job, tmp_db):
+    """Batch results follow input order and cover both match paths."""
+    mark_as_sent_batch([
+        (make_job(url="https://a/1", title="CSM", company="Acme"), 10.0),
+        (make_job(url="https://a/2", title="TAM", company="Beta"), 20.0),
+    ], db_path=tmp_db)
+    jobs = [
+        make_job(url="https://a/1", title="Renamed", company="Other"),  # same URL
+        make_job(url="https://x/9", title="Something Else", company="Acme"),
+        make_job(url="https://b/2", title="tam ", company="Beta"),  # same company+title
+    ]
+    assert was_previously_sent_batch(jobs, tmp_db) == [True, False, True]
+    assert was_previously_sent_batch([], tmp_db) == []
+
+
+def test_reset_db_removes_database(make_job, tmp_db):
+    """reset_db drops the shared connection and the file; init_db starts fresh."""
+    mark_as_sent(make_job(), db_path=tmp_db)
+    assert reset_db(tmp_db) is True
+    assert not os.path.exists(tmp_db)
+    init_db(tmp_db)
+    assert was_previously_sent(make_job(), tmp_db) is False
+
+
+def test_init_db_rehashes_rows_from_older_versions(make_job, tmp_path):
+    """Rows stored with the old SHA-256 title hash still match by title."""
+    import hashlib
+
+    db_path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE seen_jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE, "
+        "title TEXT, title_hash TEXT, company TEXT, source TEXT, "
+        "first_seen DATE DEFAULT CURRENT_DATE, score REAL DEFAULT 0, status TEXT DEFAULT 'new')"
+    )
+    old_hash = hashlib.sha256(b"customer success manager").hexdigest()[:16]
+    conn.execute(
+        "INSERT INTO seen_jobs (url, title, title_hash, company) VALUES (?, ?, ?, ?)",
+        ("https://old/1", "Customer Success Manager", old_hash, "TestCorp"),
+    )
+    conn.commit()
+    conn.close()
+
+    init_db(db_path)
+    job = make_job(url="https://new/1", title="Customer Success Manager", company="TestCorp")
+    assert was_previously_sent(job, db_path) is True
+
+
 # --- _stable_hash ---
 
 
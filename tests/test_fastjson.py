@@ -0,0 +1,31 @@
+"""Tests for fastjson.py — orjson with stdlib fallback."""
+
+import pytest
+
+import fastjson
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (if installed) and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(fastjson, "orjson", None)
+    elif fastjson.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_round_trip(backend):
+    """dumps returns compact UTF-8 bytes that loads reads back."""
+    obj = {"title": "Café Manager", "score": 42, "tags": ["a", "b"]}
+    data = fastjson.dumps(obj)
+    assert isinstance(data, bytes)
+    assert b" " not in data.replace("Café Manager".encode(), b"")
+    assert fastjson.loads(data) == obj
+    assert fastjson.loads(data.decode()) == obj
+
+
+def test_invalid_json_raises_stdlib_error(backend):
+    """Decode errors are catchable as json.JSONDecodeError for either backend."""
+    with pytest.raises(fastjson.JSONDecodeError):
+        fastjson.loads("{not json")
@@ -7,8 +7,10 @@ from freezegun import freeze_time
 
 from filters import (
     _is_boston,
+    _is_pinned_to_non_boston_location,
     _is_non_us,
     _is_us_wide_remote,
+    _keyword_pattern,
     _passes_age_filter,
     _passes_location_filter,
     passes_hard_filters,
@@ -116,6 +118,23 @@ def test_age_filter_naive_datetime(make_job):
     assert _passes_age_filter(job) is True
 
 
+def test_age_filter_uses_supplied_now(make_job):
+    """A caller-supplied now is used instead of reading the clock."""
+    posted = datetime(2026, 2, 14, 10, 0, 0, tzinfo=timezone.utc)
+    job = make_job(posted_date=posted, location="Remote")
+    assert _passes_age_filter(job, (posted + timedelta(days=5)).timestamp()) is True
+    assert _passes_age_filter(job, (posted + timedelta(days=45)).timestamp()) is False
+    assert passes_hard_filters(job, (posted + timedelta(days=45)).timestamp()) is False
+
+
+def test_age_filter_boundary_counts_whole_days(make_job):
+    """A job is stale only once it is a full day past MAX_JOB_AGE_DAYS."""
+    posted = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    job = make_job(posted_date=posted, location="Remote")
+    assert _passes_age_filter(job, (posted + timedelta(days=30, hours=23)).timestamp()) is True
+    assert _passes_age_filter(job, (posted + timedelta(days=31)).timestamp()) is False
+
+
 # --- Location filter ---
 
 
@@ -182,3 +201,29 @@ def test_is_non_us_short_signals_word_boundary():
     assert _is_non_us("uk") is True
     assert _is_non_us("bulk order") is False
     assert _is_non_us("uae") is True
+
+
+def test_keyword_pattern_matches_any_substring():
+    """_keyword_pattern finds any keyword, including ones sharing a prefix."""
+    pattern = _keyword_pattern(["new york", "new jersey", "newark", "new"])
+    assert pattern.search("remote - new jersey") is not None
+    assert pattern.search("renewal") is not None
+    assert pattern.search("boston, ma") is None
+    assert _keyword_pattern(["a.b"]).search("axb") is None
+
+
+def test_keyword_pattern_whole_word_keeps_longer_keywords():
+    """With whole_word, a keyword that extends a shorter one still matches alone."""
+    pattern = _keyword_pattern(["us", "usa", "uk"], whole_word=True)
+    assert pattern.search("remote, usa") is not None
+    assert pattern.search("remote, us") is not None
+    assert pattern.search("usability") is None
+    assert pattern.search("bulk") is None
+
+
+def test_pinned_to_state_name_and_abbreviation():
+    """Locations naming a non-Boston state or city, or its abbreviation, are pinned."""
+    assert _is_pinned_to_non_boston_location("north carolina", "North Carolina") is True
+    assert _is_pinned_to_non_boston_location("austin, tx", "Austin, TX") is True
+    assert _is_pinned_to_non_boston_location("tx, usa", "TX, USA") is True
+    assert _is_pinned_to_non_boston_location("boston, ma", "Boston, MA") is False
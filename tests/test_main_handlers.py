@@ -305,3 +305,59 @@ def test_get_reports_excludes_index(dashboard_server, tmp_path):
     filenames = [r["filename"] for r in data]
     assert "index.html" not in filenames
     assert "2026-02-19.html" in filenames
+
+
+# --- Progress stream ---
+
+
+@pytest.fixture
+def stream_handler():
+    """A real DashboardHandler writing its stream into a BytesIO, no socket."""
+    import socketserver
+
+    import main
+
+    captured = {}
+
+    def capture(server, address, handler_class, *args, **kwargs):
+        captured["cls"] = handler_class
+        raise KeyboardInterrupt  # stop serve_dashboard before it binds
+
+    with patch("dashboard.generate_landing_page"), \
+         patch.object(socketserver.TCPServer, "__init__", capture), \
+         pytest.raises(KeyboardInterrupt):
+        main.serve_dashboard(0)
+
+    handler = object.__new__(captured["cls"])
+    handler.wfile = BytesIO()
+    handler.send_response = handler.send_header = handler.end_headers = MagicMock()
+    return handler
+
+
+def test_stream_result_is_last_line(stream_handler):
+    """Progress batched before the result is flushed first; later progress is dropped."""
+    import time
+
+    h = stream_handler
+    h._start_stream()
+    h._send_progress("one")
+    h._send_progress("two\nthree")
+    h._send_result({"jobs": []})
+    h._send_progress("late")
+    time.sleep(h._PROGRESS_WINDOW * 3)
+    h._end_stream()
+
+    assert h.wfile.getvalue().decode().splitlines() == [
+        "P one", "P two", "P three", 'R {"jobs": []}',
+    ]
+
+
+def test_stream_end_after_close_does_not_raise(stream_handler):
+    """Pending progress is discarded quietly once the response is closed."""
+    h = stream_handler
+    h._start_stream()
+    h._send_progress("pending")
+    h.wfile.close()
+    h._flush_progress()
+    h._end_stream()
+    assert h._progress_timer is None
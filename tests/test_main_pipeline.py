@@ -52,9 +52,9 @@ def test_pipeline_no_results(mock_init_db, mock_ai, mock_report, mock_dash):
 @patch("main.generate_dashboard")
 @patch("main.save_daily_report")
 @patch("main.score_top_jobs")
-@patch("main.mark_as_sent")
-@patch("main.was_previously_sent", return_value=False)
-@patch("main.is_duplicate", return_value=False)
+@patch("main.mark_as_sent_batch")
+@patch("main.was_previously_sent_batch", side_effect=lambda jobs, db_path: [False] * len(jobs))
+@patch("main.dedupe", side_effect=lambda jobs: jobs)
 @patch("main.passes_hard_filters", return_value=True)
 @patch("main.init_db")
 def test_pipeline_end_to_end(
@@ -82,6 +82,9 @@ def test_pipeline_end_to_end(
 
     assert len(result) == 1
     assert result[0]["title"] == "Customer Success Manager"
+    [(marked_job, marked_score)] = mock_mark.call_args.args[0]
+    assert marked_job is job
+    assert marked_score == result[0]["score"]
     mock_report.assert_called_once()
     mock_dash.assert_called_once()
 
@@ -122,8 +125,8 @@ def test_source_failure_isolated(mock_init_db, mock_ai, mock_report, mock_dash):
 @patch("main.generate_dashboard")
 @patch("main.save_daily_report")
 @patch("main.score_top_jobs")
-@patch("main.mark_as_sent")
-@patch("main.was_previously_sent", return_value=False)
+@patch("main.mark_as_sent_batch")
+@patch("main.was_previously_sent_batch", side_effect=lambda jobs, db_path: [False] * len(jobs))
 @patch("main.passes_hard_filters", return_value=True)
 @patch("main.init_db")
 def test_dedup_removes_cross_source_duplicates(
@@ -160,9 +163,9 @@ def test_dedup_removes_cross_source_duplicates(
 @patch("main.generate_dashboard")
 @patch("main.save_daily_report")
 @patch("main.score_top_jobs")
-@patch("main.mark_as_sent")
-@patch("main.was_previously_sent")
-@patch("main.is_duplicate", return_value=False)
+@patch("main.mark_as_sent_batch")
+@patch("main.was_previously_sent_batch")
+@patch("main.dedupe", side_effect=lambda jobs: jobs)
 @patch("main.passes_hard_filters", return_value=True)
 @patch("main.init_db")
 def test_previously_sent_excluded(
@@ -171,7 +174,7 @@ def test_previously_sent_excluded(
 ):
     """Jobs in seen_jobs.db are excluded from results."""
     job = _make_job()
-    mock_sent.return_value = True  # All jobs have been sent before
+    mock_sent.side_effect = lambda jobs, db_path: [True] * len(jobs)  # All sent before
     mock_ai.return_value = []
     mock_report.return_value = "reports/2026-02-19.md"
 
@@ -189,3 +192,25 @@ def test_previously_sent_excluded(
         result = run_pipeline()
 
     assert result == []
+
+
+def test_collect_all_runs_sources_concurrently_in_order():
+    """collect_all overlaps source fetches but keeps results in source order."""
+    import threading
+
+    from main import collect_all
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def source(name):
+        src = MagicMock()
+
+        def safe_collect():
+            barrier.wait()  # times out unless both sources run at once
+            return [_make_job(title=name)]
+
+        src.safe_collect.side_effect = safe_collect
+        return src
+
+    jobs = collect_all([source("first"), source("second")])
+    assert [j.title for j in jobs] == ["first", "second"]
@@ -1,6 +1,6 @@
 """Tests for scorer.py — rule-based scoring logic."""
 
-from scorer import rule_based_score
+from scorer import rule_based_score, rule_based_scores
 
 
 # --- Title match scoring (0-15 pts) ---
@@ -165,3 +165,14 @@ def test_case_insensitive_matching(make_job):
     score = rule_based_score(job)
     # Skills and industry should match despite uppercase
     assert score >= 5 + 3 + 5  # title + 3 skills + 2 industry
+
+
+def test_batch_scores_match_single(make_job):
+    """rule_based_scores agrees with scoring each job on its own."""
+    jobs = [
+        make_job(title="Application Support Manager", company="SentinelOne", description=""),
+        make_job(description="A role in cybersecurity and saas environment"),
+        make_job(company="RandomCorp", salary_min=0),
+    ]
+    assert rule_based_scores(jobs) == [rule_based_score(j) for j in jobs]
+    assert rule_based_scores([]) == []